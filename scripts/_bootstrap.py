@@ -0,0 +1,23 @@
+"""
+Shared bootstrap for the standalone test scripts.
+
+Every script in this directory needs the project root on sys.path before
+it can import src.*. Import this module before any src import:
+
+    if __package__:
+        from . import _bootstrap  # noqa: F401  (pytest imports scripts as a package)
+    else:
+        import _bootstrap  # noqa: F401  (python scripts/test_*.py)
+
+Only the path setup lives here on purpose: each script imports just the
+src modules it actually exercises, so a lightweight script (e.g. the
+config wizard test) never pays the import cost of the extractor or
+provider stacks.
+"""
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
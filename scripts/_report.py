@@ -0,0 +1,38 @@
+"""
+Buffered console reporting for the standalone test scripts.
+
+The scripts emit dozens of tiny ``print`` calls per run; each one flushes
+stdout and pays a syscall, which adds up when output is piped to a log
+file. Reporter collects lines in memory and writes them out in one
+``sys.stdout.write`` per flush. Call ``flush()`` at the end of each major
+phase so interactive runs still show progress between slow steps.
+"""
+import sys
+
+
+class Reporter:
+    """Buffered stdout writer with the scripts' section/separator format."""
+
+    def __init__(self):
+        self._buf = []
+
+    def line(self, text=""):
+        """Buffer one output line (like print)."""
+        self._buf.append(f"{text}\n")
+
+    def separator(self, char='=', length=80):
+        """Buffer a separator line."""
+        self._buf.append(char * length + "\n")
+
+    def section(self, title):
+        """Buffer a section header."""
+        rule = "=" * 80
+        self._buf.append(f"\n{rule}\n {title}\n{rule}\n\n")
+
+    def flush(self):
+        """Write all buffered output to stdout in a single call."""
+        if not self._buf:
+            return
+        sys.stdout.write("".join(self._buf))
+        sys.stdout.flush()
+        self._buf.clear()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Batch vision test: analyze every image in a directory.
+
+Usage:
+    python scripts/batch_vision.py <directory> [prompt]
+    python scripts/batch_vision.py output/2025-01-15 "Is this a comic strip?"
+
+File reads and vision requests run on a thread pool so disk and HTTP
+latency overlap across images instead of serializing per file.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+    from ._report import Reporter
+else:
+    import _bootstrap  # noqa: F401
+    from _report import Reporter
+
+from src.lm_studio_client.vision_processor import LMStudioVisionClient
+from src.config import LM_STUDIO_VISION_MODEL, LM_STUDIO_BASE_URL
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+
+report = Reporter()
+
+
+def find_images(directory):
+    """
+    Collect image paths from a directory with one scandir pass.
+
+    DirEntry caches the stat from the directory read, so is_file() costs
+    no extra syscall per entry.
+
+    Returns:
+        Sorted list of image file paths
+    """
+    paths = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                paths.append(entry.path)
+    return sorted(paths)
+
+
+def analyze_one(vision_client, path, prompt, model):
+    """Analyze a single image (runs on the worker pool)."""
+    return vision_client.analyze_image(path, prompt, model=model)
+
+
+def main():
+    """Main batch function."""
+    parser = argparse.ArgumentParser(
+        description='Analyze every image in a directory with the LM Studio vision model',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Describe all downloaded comics from a run
+  %(prog)s output/2025-01-15
+
+  # Custom prompt
+  %(prog)s output/2025-01-15 "Is this a comic strip?"
+        """
+    )
+
+    parser.add_argument(
+        'directory',
+        help='Directory containing the images'
+    )
+
+    parser.add_argument(
+        'prompt',
+        nargs='?',
+        default="Describe this image in detail.",
+        help='Prompt applied to every image (default: "Describe this image in detail.")'
+    )
+
+    parser.add_argument(
+        '--model',
+        type=str,
+        default=LM_STUDIO_VISION_MODEL,
+        help=f'Vision model to use (default: {LM_STUDIO_VISION_MODEL})'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Concurrent requests (default: 4, conservative for local backends)'
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        report.line(f"ERROR: Not a directory: {args.directory}")
+        report.flush()
+        return 1
+
+    images = find_images(args.directory)
+    if not images:
+        report.line(f"ERROR: No images found in {args.directory}")
+        report.flush()
+        return 1
+
+    report.section("LM Studio Batch Vision Test")
+    report.line(f"Directory: {args.directory}")
+    report.line(f"Images: {len(images)}")
+    report.line(f"Model: {args.model}")
+    report.line(f"Server: {LM_STUDIO_BASE_URL}")
+    report.line(f"Prompt: {args.prompt}")
+
+    try:
+        vision_client = LMStudioVisionClient(model=args.model)
+    except Exception as e:
+        report.line(f"ERROR: Failed to initialize vision client: {e}")
+        report.flush()
+        return 1
+
+    if not vision_client.client.health_check():
+        report.line("ERROR: LM Studio server is not available!")
+        report.line(f"Please start LM Studio at {LM_STUDIO_BASE_URL} and try again.")
+        report.flush()
+        return 1
+
+    report.line("LM Studio server is available")
+    report.flush()
+
+    failures = 0
+    workers = min(len(images), args.workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_path = {
+            executor.submit(analyze_one, vision_client, path, args.prompt, args.model): path
+            for path in images
+        }
+
+        for future in as_completed(future_to_path):
+            path = future_to_path[future]
+            report.section(f"Image: {os.path.basename(path)}")
+
+            try:
+                response = future.result()
+            except Exception as e:
+                report.line(f"ERROR: Analysis failed: {e}")
+                report.flush()
+                failures += 1
+                continue
+
+            if not response:
+                report.line("ERROR: Failed to analyze image")
+                failures += 1
+            else:
+                report.line(response)
+
+            report.flush()
+
+    report.section("Batch Complete")
+    report.line(f"Processed {len(images)} images: "
+                f"{len(images) - failures} succeeded, {failures} failed")
+    report.flush()
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
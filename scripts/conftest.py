@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for the integration test scripts.
+
+The scripts stay runnable standalone (python scripts/test_*.py); under
+pytest the same test functions resolve their shared clients from these
+session-scoped fixtures, so client construction and the HTTP connection
+pool are reused across all tests instead of being rebuilt per test:
+
+    pytest scripts/ -k lm_studio
+"""
+import pytest
+
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+else:
+    import _bootstrap  # noqa: F401
+
+from src.config import LM_STUDIO_BASE_URL
+from src.lm_studio_client.client import LMStudioClient
+
+
+@pytest.fixture(scope='session')
+def client():
+    """Shared LM Studio client (one connection pool per test session)."""
+    return LMStudioClient(base_url=LM_STUDIO_BASE_URL)
+
+
+@pytest.fixture(scope='session')
+def feed_url():
+    """Known comic feed used by the feed type detection tests."""
+    return "https://xkcd.com/rss.xml"
+
+
+@pytest.fixture
+def image_path():
+    """No image by default - vision tests handle the missing-image path."""
+    return None
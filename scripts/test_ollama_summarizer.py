@@ -3,36 +3,140 @@
 Standalone test script for AI summarizer (Ollama, LM Studio, etc.)
 
 Usage:
-    python scripts/test_ollama_summarizer.py <url>
+    python scripts/test_ollama_summarizer.py <url> [<url> ...]
     python scripts/test_ollama_summarizer.py <url> --author "Francesca Testa"
     python scripts/test_ollama_summarizer.py <url> --model "granite4:tiny-h" --verbose
     python scripts/test_ollama_summarizer.py <url> --ai-provider lm_studio
+
+With several URLs, extraction runs on a thread pool while summaries are
+generated, so HTTP latency hides under LLM inference time.
 """
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+    from ._report import Reporter
+else:
+    import _bootstrap  # noqa: F401
+    from _report import Reporter
 
 from src.news.article_extractor import ArticleExtractor
 from src.news.content_cleaner import ContentCleaner
+from src.news.content_cache import ContentCache
 from src.ai_client import create_ai_client_with_fallback
-from src.config import TEXT_MODEL, CLICKBAIT_AUTHORS, AI_PROVIDER
+from src.config import TEXT_MODEL, CLICKBAIT_AUTHORS, AI_PROVIDER, MAX_CONCURRENT_FEEDS
+
+
+report = Reporter()
+
+
+def extract_and_clean(extractor, cleaner, url, cache=None):
+    """
+    Extract and clean one article (runs on the extraction thread pool).
+
+    Returns:
+        dict with article, cleaned text and validation, or None if
+        extraction failed
+    """
+    if cache:
+        cached = cache.get(url)
+        if cached:
+            return cached
+
+    article_data = extractor.extract_from_url(url)
+
+    if not article_data:
+        return None
+
+    cleaned_text = cleaner.clean_text(article_data['text'])
+    validation = cleaner.validate_article_content(cleaned_text)
+
+    if cache:
+        return cache.put(url, article_data, cleaned_text, validation)
+
+    return {
+        'article': article_data,
+        'cleaned_text': cleaned_text,
+        'validation': validation
+    }
+
+
+def summarize_and_report(extracted, url, args, text_processor):
+    """
+    Summarize one extracted article and print the detailed report.
+
+    Returns:
+        True on success, False on any failure
+    """
+    article_data = extracted['article']
+    cleaned_text = extracted['cleaned_text']
+    validation = extracted['validation']
+
+    report.section(f"Article: {url}")
+    report.line(f"Title: {article_data.get('title', 'N/A')}")
+    report.line(f"Author: {article_data.get('author', 'N/A')}")
+    report.line(f"Date: {article_data.get('date', 'N/A')}")
+    report.line(f"Text length: {len(article_data.get('text', ''))} characters")
+    report.line(f"Cleaned text length: {len(cleaned_text)} characters")
+
+    if args.verbose:
+        report.line("\nFirst 500 characters of cleaned text:")
+        report.line(cleaned_text[:500])
 
+    report.line(f"Validation: {'PASSED' if validation['valid'] else 'FAILED'}")
+    report.line(f"Word count: {validation['word_count']}")
+    report.line(f"Character count: {validation['char_count']}")
 
-def print_separator(char='=', length=80):
-    """Print a separator line."""
-    print(char * length)
+    if not validation['valid']:
+        report.line(f"Reason: {validation['reason']}")
+        return False
+
+    # Generate summary
+    report.section("Generating Summary")
+
+    # Override author if specified
+    author = args.author or article_data.get('author')
+    title = article_data.get('title', '')
 
+    try:
+        summary_data = text_processor.generate_summary(cleaned_text, title=title, author=author)
 
-def print_section(title):
-    """Print a section header."""
-    print()
-    print_separator()
-    print(f" {title}")
-    print_separator()
-    print()
+        if not summary_data:
+            report.line("ERROR: Failed to generate summary")
+            return False
+
+        report.line("Summary generated successfully!")
+        report.line(f"Is clickbait: {summary_data.get('is_clickbait', False)}")
+        if summary_data.get('clickbait_detected_by'):
+            report.line(f"Detected by: {summary_data.get('clickbait_detected_by')}")
+
+    except Exception as e:
+        report.line(f"ERROR: Failed to generate summary: {e}")
+        return False
+
+    # Display results
+    report.section("Results")
+
+    report.line(f"Original Title: {article_data.get('title', 'N/A')}")
+    report.line()
+    report.line(f"Generated Title: {summary_data['title']}")
+    report.line()
+    report.line("Summary:")
+    report.separator('-')
+    report.line(summary_data['summary'])
+    report.separator('-')
+
+    # Statistics
+    report.section("Statistics")
+    report.line(f"Original text: {len(cleaned_text)} characters, {validation['word_count']} words")
+    report.line(f"Summary: {len(summary_data['summary'])} characters")
+    report.line(f"Compression ratio: {len(summary_data['summary']) / len(cleaned_text) * 100:.1f}%")
+
+    return True
 
 
 def main():
@@ -57,8 +161,10 @@ Examples:
     )
 
     parser.add_argument(
-        'url',
-        help='URL of the article to summarize'
+        'urls',
+        nargs='+',
+        metavar='url',
+        help='URL(s) of the article(s) to summarize'
     )
 
     parser.add_argument(
@@ -80,6 +186,12 @@ Examples:
         help='Show detailed information'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Skip the persistent content cache and re-extract every URL'
+    )
+
     parser.add_argument(
         '--ai-provider',
         type=str,
@@ -97,125 +209,86 @@ Examples:
         provider_name = args.ai_provider
 
     # Print header
-    print_section("AI Summarizer Test")
-    print(f"URL: {args.url}")
-    print(f"Provider: {provider_name}")
-    print(f"Model: {args.model}")
+    report.section("AI Summarizer Test")
+    for url in args.urls:
+        report.line(f"URL: {url}")
+    report.line(f"Provider: {provider_name}")
+    report.line(f"Model: {args.model}")
     if args.author:
-        print(f"Author: {args.author}")
+        report.line(f"Author: {args.author}")
         if args.author in CLICKBAIT_AUTHORS:
-            print("  (Clickbait author detected - will use special prompt)")
+            report.line("  (Clickbait author detected - will use special prompt)")
 
     # Initialize AI clients using factory
-    print_section(f"Checking {provider_name} Server")
+    report.section(f"Checking {provider_name} Server")
     try:
         ai_client, text_processor, vision_processor = create_ai_client_with_fallback()
     except Exception as e:
-        print(f"ERROR: Failed to initialize AI client: {e}")
+        report.line(f"ERROR: Failed to initialize AI client: {e}")
+        report.flush()
         return 1
 
     if not ai_client.health_check():
-        print(f"ERROR: {provider_name} server is not available!")
-        print(f"Please start {provider_name} and try again.")
+        report.line(f"ERROR: {provider_name} server is not available!")
+        report.line(f"Please start {provider_name} and try again.")
+        report.flush()
         return 1
 
-    print(f"{provider_name} server is available")
+    report.line(f"{provider_name} server is available")
 
     # List models
     models = ai_client.list_models()
-    print(f"Available models: {', '.join(models)}")
+    report.line(f"Available models: {', '.join(models)}")
 
     if args.model not in models:
-        print(f"WARNING: Model '{args.model}' not found in available models")
-
-    # Extract article
-    print_section("Extracting Article")
-    extractor = ArticleExtractor()
-
-    try:
-        article_data = extractor.extract_from_url(args.url)
-
-        if not article_data:
-            print("ERROR: Failed to extract article")
-            return 1
+        report.line(f"WARNING: Model '{args.model}' not found in available models")
 
-        print(f"Title: {article_data.get('title', 'N/A')}")
-        print(f"Author: {article_data.get('author', 'N/A')}")
-        print(f"Date: {article_data.get('date', 'N/A')}")
-        print(f"Text length: {len(article_data.get('text', ''))} characters")
+    report.flush()
 
-        if args.verbose:
-            print("\nFirst 500 characters:")
-            print(article_data.get('text', '')[:500])
-
-    except Exception as e:
-        print(f"ERROR: Failed to extract article: {e}")
-        return 1
-
-    # Clean content
-    print_section("Cleaning Content")
+    # Extract and summarize as a pipeline: extraction (HTTP + parse) runs
+    # on a thread pool while the main thread feeds completed articles to
+    # the LLM, so fetch latency hides under inference time
+    extractor = ArticleExtractor()
     cleaner = ContentCleaner()
+    cache = None if args.no_cache else ContentCache()
 
-    cleaned_text = cleaner.clean_text(article_data['text'])
-    print(f"Cleaned text length: {len(cleaned_text)} characters")
+    outcomes = []
+    workers = min(len(args.urls), MAX_CONCURRENT_FEEDS)
 
-    # Validate content
-    validation = cleaner.validate_article_content(cleaned_text)
-    print(f"Validation: {'PASSED' if validation['valid'] else 'FAILED'}")
-    print(f"Word count: {validation['word_count']}")
-    print(f"Character count: {validation['char_count']}")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_url = {
+            executor.submit(extract_and_clean, extractor, cleaner, url, cache): url
+            for url in args.urls
+        }
 
-    if not validation['valid']:
-        print(f"Reason: {validation['reason']}")
-        return 1
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
 
-    if args.verbose:
-        print("\nFirst 500 characters of cleaned text:")
-        print(cleaned_text[:500])
-
-    # Generate summary
-    print_section("Generating Summary")
-
-    # Override author if specified
-    author = args.author or article_data.get('author')
-    title = article_data.get('title', '')
-
-    try:
-        summary_data = text_processor.generate_summary(cleaned_text, title=title, author=author)
+            try:
+                extracted = future.result()
+            except Exception as e:
+                report.line(f"ERROR: Failed to extract article from {url}: {e}")
+                outcomes.append(False)
+                continue
 
-        if not summary_data:
-            print("ERROR: Failed to generate summary")
-            return 1
+            if not extracted:
+                report.line(f"ERROR: Failed to extract article from {url}")
+                outcomes.append(False)
+                continue
 
-        print("Summary generated successfully!")
-        print(f"Is clickbait: {summary_data.get('is_clickbait', False)}")
-        if summary_data.get('clickbait_detected_by'):
-            print(f"Detected by: {summary_data.get('clickbait_detected_by')}")
+            outcomes.append(summarize_and_report(extracted, url, args, text_processor))
 
-    except Exception as e:
-        print(f"ERROR: Failed to generate summary: {e}")
-        return 1
+            # One write per article keeps progress visible between slow LLM calls
+            report.flush()
 
-    # Display results
-    print_section("Results")
-
-    print(f"Original Title: {article_data.get('title', 'N/A')}")
-    print()
-    print(f"Generated Title: {summary_data['title']}")
-    print()
-    print("Summary:")
-    print_separator('-')
-    print(summary_data['summary'])
-    print_separator('-')
-
-    # Statistics
-    print_section("Statistics")
-    print(f"Original text: {len(cleaned_text)} characters, {validation['word_count']} words")
-    print(f"Summary: {len(summary_data['summary'])} characters")
-    print(f"Compression ratio: {len(summary_data['summary']) / len(cleaned_text) * 100:.1f}%")
+    if len(outcomes) > 1:
+        report.section("Batch Summary")
+        report.line(f"Processed {len(outcomes)} URLs: "
+              f"{sum(outcomes)} succeeded, {len(outcomes) - sum(outcomes)} failed")
 
-    print_section("Test Complete")
-    return 0
+    report.section("Test Complete")
+    report.flush()
+    return 0 if all(outcomes) else 1
 
 
 if __name__ == "__main__":
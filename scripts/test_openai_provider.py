@@ -27,10 +27,14 @@ import argparse
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Shared path setup so src.* imports resolve (standalone and under pytest)
+if __package__:
+    from . import _bootstrap  # noqa: F401
+else:
+    import _bootstrap  # noqa: F401
 
 from src.openai_provider import OpenAIClient, OpenAITextProcessor, OpenAIVisionProcessor
+from src.config import OPENAI_VISION_MODEL
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -91,8 +95,12 @@ def test_text_summarization():
     print("Testing Text Summarization")
     print("="*60)
 
-    # Sample article text
+    # Sample article text - keys in BaseTextProcessor.CANONICAL_KEYS order
+    # so prompts built from this dict match production prompt prefixes
     article = {
+        'title': 'Advances in AI Language Models',
+        'author': 'Tech Reporter',
+        'url': 'https://example.com/ai-article',
         'text': """
         Artificial intelligence has made remarkable progress in recent years,
         particularly in the field of natural language processing. Large language
@@ -101,10 +109,7 @@ def test_text_summarization():
         from chatbots to content creation, translation, and code generation.
         However, challenges remain in areas such as reasoning, factual accuracy,
         and avoiding biases present in training data.
-        """,
-        'title': 'Advances in AI Language Models',
-        'author': 'Tech Reporter',
-        'url': 'https://example.com/ai-article'
+        """
     }
 
     try:
@@ -177,7 +182,7 @@ def test_clickbait_detection():
         return False
 
 
-def test_vision_processing(image_path=None):
+def test_vision_processing(image_path=None, model=OPENAI_VISION_MODEL):
     """Test vision processing."""
     print("\n" + "="*60)
     print("Testing Vision Processing")
@@ -193,8 +198,8 @@ def test_vision_processing(image_path=None):
         return False
 
     try:
-        processor = OpenAIVisionProcessor(model="gpt-4o")
-        print(f"Using model: gpt-4o")
+        processor = OpenAIVisionProcessor(model=model)
+        print(f"Using model: {model}")
         print(f"Analyzing image: {image_path}")
 
         result = processor.analyze_image(
@@ -231,6 +236,11 @@ def main():
         '--image',
         help='Path to image file for vision testing'
     )
+    parser.add_argument(
+        '--vision-model',
+        default=OPENAI_VISION_MODEL,
+        help=f'Vision model to use (default: {OPENAI_VISION_MODEL})'
+    )
 
     args = parser.parse_args()
 
@@ -259,7 +269,7 @@ def main():
         results['clickbait'] = test_clickbait_detection()
 
     if args.test in ['vision', 'all']:
-        results['vision'] = test_vision_processing(args.image)
+        results['vision'] = test_vision_processing(args.image, model=args.vision_model)
 
     # Print summary
     print("\n" + "="*60)
@@ -6,12 +6,45 @@ allowing the application to switch between Ollama, LM Studio, and other
 providers without changing the rest of the codebase.
 """
 
+import importlib
+
 from .base import BaseAIClient, BaseTextProcessor
 from .factory import create_ai_client, create_ai_client_with_fallback
 
+# Provider classes are exposed lazily (PEP 562): importing src.ai_client
+# stays cheap, and each provider package - with whatever SDKs it needs -
+# loads only on first attribute access.
+_LAZY_CLASSES = {
+    'OllamaClient': '..ollama_client.client',
+    'OllamaTextClient': '..ollama_client.text_processor',
+    'OllamaVisionClient': '..ollama_client.vision_processor',
+    'LMStudioClient': '..lm_studio_client.client',
+    'LMStudioTextClient': '..lm_studio_client.text_processor',
+    'LMStudioVisionClient': '..lm_studio_client.vision_processor',
+    'OpenAIClient': '..openai_provider.client',
+    'OpenAITextProcessor': '..openai_provider.text_processor',
+    'OpenAIVisionProcessor': '..openai_provider.vision_processor',
+    'GeminiClient': '..gemini_provider.client',
+    'GeminiTextClient': '..gemini_provider.text_processor',
+    'GeminiVisionClient': '..gemini_provider.vision_processor',
+    'ClaudeClient': '..claude_provider.client',
+    'ClaudeTextClient': '..claude_provider.text_processor',
+    'ClaudeVisionClient': '..claude_provider.vision_processor',
+}
+
 __all__ = [
     'BaseAIClient',
     'BaseTextProcessor',
     'create_ai_client',
     'create_ai_client_with_fallback',
-]
+] + list(_LAZY_CLASSES)
+
+
+def __getattr__(name):
+    """Load a provider class on first access and cache it in the namespace."""
+    target = _LAZY_CLASSES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(target, __package__), name)
+    globals()[name] = value
+    return value
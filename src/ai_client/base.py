@@ -5,8 +5,37 @@ This module provides the abstract base classes that all AI provider clients
 must implement to ensure consistent interfaces across different providers
 (Ollama, LM Studio, etc.).
 """
+import json
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Optional, List, Dict, Any
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Unstripped markup in "cleaned" text means extraction went wrong upstream -
+# compiled once so the per-article precheck stays cheap
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Title patterns so blatant that no LLM opinion is needed - compiled once,
+# checked before any clickbait-detection request
+_CLICKBAIT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"you won'?t believe",
+        r"this one (?:weird )?trick",
+        r"will (?:blow your mind|shock you)",
+        r"number \d+ will",
+        r"what happen(?:s|ed) next",
+        r"doctors hate",
+    )
+]
 
 
 class BaseAIClient(ABC):
@@ -17,6 +46,43 @@ class BaseAIClient(ABC):
     to ensure consistent API across different providers.
     """
 
+    # Concurrent requests used by the default batch implementations -
+    # conservative so local single-GPU backends aren't overwhelmed
+    MAX_BATCH_WORKERS = 4
+
+    # How long a list_models() result stays fresh - the test scripts and
+    # provider factory all call it right after health_check on the same server
+    MODELS_CACHE_TTL = 60  # seconds
+
+    def __init__(self):
+        """
+        Initialize shared client state.
+
+        Subclasses must call super().__init__() so every request reuses one
+        persistent HTTP session (keep-alive + TLS session resumption)
+        instead of opening a fresh socket per call.
+        """
+        self._session = requests.Session()
+        self._models_cache: Optional[List[str]] = None
+        self._models_cache_time = 0.0
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def _cached_models(self) -> Optional[List[str]]:
+        """Return the memoized list_models() result if still fresh, else None."""
+        if (self._models_cache is not None
+                and time.time() - self._models_cache_time < self.MODELS_CACHE_TTL):
+            return self._models_cache
+        return None
+
+    def _remember_models(self, models: List[str]) -> List[str]:
+        """Memoize a successful list_models() result and return it."""
+        self._models_cache = models
+        self._models_cache_time = time.time()
+        return models
+
     @abstractmethod
     def health_check(self) -> bool:
         """
@@ -44,7 +110,8 @@ class BaseAIClient(ABC):
         prompt: str,
         system: Optional[str] = None,
         temperature: float = 0.3,
-        images: Optional[List[str]] = None
+        images: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None
     ) -> Optional[str]:
         """
         Generate text using the AI model.
@@ -55,6 +122,9 @@ class BaseAIClient(ABC):
             system: System prompt (optional)
             temperature: Generation temperature (0.0 to 1.0)
             images: List of base64-encoded images for vision models (optional)
+            max_tokens: Cap on generated tokens (None = provider default).
+                Classification-style calls should pass a small cap so the
+                server stops decoding after the answer token.
 
         Returns:
             Generated text, or None on error
@@ -81,6 +151,81 @@ class BaseAIClient(ABC):
         """
         pass
 
+    def generate_batch(
+        self,
+        model: str,
+        prompts: List[str],
+        system: Optional[str] = None,
+        temperature: float = 0.3
+    ) -> List[Optional[str]]:
+        """
+        Generate text for several prompts in one batch.
+
+        The default implementation fans the prompts out over a small thread
+        pool so network and inference latency overlap instead of adding up.
+        Providers with a native batch API can override this with a single
+        batched call.
+
+        Args:
+            model: Model name to use
+            prompts: List of user prompts
+            system: System prompt applied to every prompt (optional)
+            temperature: Generation temperature (0.0 to 1.0)
+
+        Returns:
+            List of generated texts (None entries for failures), in the
+            same order as prompts
+        """
+        if not prompts:
+            return []
+
+        workers = min(len(prompts), self.MAX_BATCH_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Keyword binding: Gemini and Claude declare prompt first and
+            # model fourth, so positional fan-out would scramble arguments
+            futures = [
+                executor.submit(self.generate, model=model, prompt=prompt,
+                                system=system, temperature=temperature)
+                for prompt in prompts
+            ]
+            return [future.result() for future in futures]
+
+    def chat_batch(
+        self,
+        model: str,
+        message_lists: List[List[Dict[str, str]]],
+        temperature: float = 0.3
+    ) -> List[Optional[str]]:
+        """
+        Run several independent chat conversations in one batch.
+
+        Same default strategy as generate_batch: overlap the requests on a
+        thread pool, preserving input order in the results.
+
+        Args:
+            model: Model name to use
+            message_lists: List of conversations (each a list of message dicts)
+            temperature: Generation temperature (0.0 to 1.0)
+
+        Returns:
+            List of responses (None entries for failures), in the same
+            order as message_lists
+        """
+        if not message_lists:
+            return []
+
+        workers = min(len(message_lists), self.MAX_BATCH_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Keyword binding for the same reason as generate_batch
+            futures = [
+                executor.submit(self.chat, model=model, messages=messages,
+                                temperature=temperature)
+                for messages in message_lists
+            ]
+            return [future.result() for future in futures]
+
 
 class BaseTextProcessor(ABC):
     """
@@ -90,6 +235,212 @@ class BaseTextProcessor(ABC):
     functionality across different AI providers.
     """
 
+    # Canonical ordering for article fields serialized into prompts. Free-form
+    # dict iteration order varies with insertion order, which breaks the
+    # prompt-prefix hashes server-side KV caches match on - always serialize
+    # through _canonical_prompt instead of iterating article_data.items().
+    CANONICAL_KEYS: ClassVar[tuple] = ("title", "author", "url", "date", "text")
+
+    # Memo of present-field combinations -> ordered key tuple. Feeds tend to
+    # produce only a handful of distinct schemas (with/without author, date),
+    # so the per-article key filtering runs once per schema instead of once
+    # per call. Shared across providers: keyed purely on field names.
+    _SCHEMA_KEYS: ClassVar[Dict[frozenset, tuple]] = {}
+
+    # Canonical system prompts shared by all providers. These must stay
+    # byte-identical from call to call: cloud providers (OpenAI, Anthropic)
+    # and local KV caches reuse a cached prompt prefix only when it matches
+    # exactly, so all per-article content belongs at the END of the user
+    # turn, never interpolated into these constants.
+    SYSTEM_PROMPT_SUMMARIZE: ClassVar[str] = (
+        "You are a professional news summarizer. "
+        "Provide clear, concise, and objective summaries of articles. "
+        "Focus on the key facts, main points, and important details. "
+        "Maintain a neutral, professional tone. "
+        "Keep summaries between 100-300 words."
+    )
+
+    SYSTEM_PROMPT_SUMMARIZE_CLICKBAIT: ClassVar[str] = (
+        "This article shows signs of clickbait or sensationalism. "
+        "Provide an objective, factual summary that strips away dramatic language "
+        "and focuses on verifiable facts only. "
+        "If no substantial facts exist, state 'Clickbait article with no substantial content.' "
+        "Maintain a neutral, skeptical tone and avoid amplifying sensationalism."
+    )
+
+    SYSTEM_PROMPT_CLICKBAIT_DETECT: ClassVar[str] = (
+        "You are a clickbait detection expert. "
+        "Analyze the article title and excerpt to determine if it is clickbait. "
+        "Clickbait indicators include: "
+        "- Sensationalized or exaggerated headlines "
+        "- Misleading titles that don't match the content "
+        "- Emotional manipulation tactics "
+        "- Exaggerated claims or promises "
+        "- 'You won't believe...', 'This one trick...', 'Shocking...' type language "
+        "- Withholding key information to force clicks "
+        "- Overly dramatic or provocative language "
+        "Respond with ONLY 'yes' if it is clickbait, or 'no' if it is not."
+    )
+
+    SYSTEM_PROMPT_TITLE: ClassVar[str] = (
+        "You are a professional headline writer. "
+        "Generate a clear, concise, and informative headline (max 80 characters) "
+        "based on the provided summary. "
+        "Do not use clickbait language or sensationalism."
+    )
+
+    # Structured summarize variants: same instructions plus a JSON contract
+    # so one constrained call yields summary AND title - no second title
+    # request, no markdown fences or preamble tokens to strip
+    SYSTEM_PROMPT_SUMMARIZE_STRUCTURED: ClassVar[str] = (
+        SYSTEM_PROMPT_SUMMARIZE +
+        " Respond with only a JSON object with keys 'summary' and 'title' "
+        "(a clear, non-clickbait headline, max 80 characters)."
+    )
+
+    SYSTEM_PROMPT_SUMMARIZE_CLICKBAIT_STRUCTURED: ClassVar[str] = (
+        SYSTEM_PROMPT_SUMMARIZE_CLICKBAIT +
+        " Respond with only a JSON object with keys 'summary' and 'title' "
+        "(a clear, non-clickbait headline, max 80 characters)."
+    )
+
+    # Schema enforced server-side where the backend supports it (Ollama
+    # format=, OpenAI-compatible response_format=)
+    SUMMARY_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "title": {"type": "string"}
+        },
+        "required": ["summary", "title"]
+    }
+
+    # OpenAI-compatible response_format wrapper around SUMMARY_SCHEMA
+    SUMMARY_RESPONSE_FORMAT: ClassVar[Dict[str, Any]] = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "summary",
+            "schema": SUMMARY_SCHEMA,
+            "strict": True
+        }
+    }
+
+    @staticmethod
+    def _obvious_clickbait(title: Optional[str]) -> bool:
+        """
+        Regex precheck for unmistakable clickbait titles.
+
+        Args:
+            title: Article title
+
+        Returns:
+            True if the title matches a known clickbait pattern - callers
+            can skip the LLM detection round-trip for these
+        """
+        if not title:
+            return False
+        return any(pattern.search(title) for pattern in _CLICKBAIT_PATTERNS)
+
+    @staticmethod
+    def _parse_structured_summary(raw: Optional[str]) -> Optional[Dict[str, str]]:
+        """
+        Parse a structured summarize response into summary and title.
+
+        Args:
+            raw: Raw model output (ideally bare JSON; fences tolerated)
+
+        Returns:
+            Dict with 'summary' and 'title' strings, or None if the output
+            does not match SUMMARY_SCHEMA
+        """
+        if not raw:
+            return None
+
+        text = raw.strip()
+
+        # Tolerate models that fence the JSON despite the constraint
+        if text.startswith('```'):
+            text = text.strip('`')
+            if text.startswith('json'):
+                text = text[4:]
+            text = text.strip()
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+
+        if (isinstance(data, dict)
+                and isinstance(data.get('summary'), str)
+                and isinstance(data.get('title'), str)):
+            return {'summary': data['summary'].strip(), 'title': data['title'].strip()}
+
+        return None
+
+    @staticmethod
+    def _clean_title(title: str) -> str:
+        """Strip quotes from a generated title and cap it at 80 characters."""
+        title = title.strip().strip('"\'')
+        if len(title) > 80:
+            title = title[:77] + "..."
+        return title or "Article Summary"
+
+    # Thresholds for the pre-LLM sanity gate in _validate. Diversity is
+    # measured over a fixed-size window because unique-character count
+    # plateaus while length keeps growing - a raw ratio over the whole
+    # text would reject every long article.
+    MIN_ARTICLE_CHARS: ClassVar[int] = 300
+    CHAR_DIVERSITY_WINDOW: ClassVar[int] = 1000
+    MIN_CHAR_DIVERSITY: ClassVar[float] = 0.02
+
+    @staticmethod
+    def _validate(text: str) -> Optional[str]:
+        """
+        Cheap sanity gate run before any LLM call.
+
+        Degenerate inputs (stub articles, repeated boilerplate, unstripped
+        HTML) still cost a full decode if they reach the model; these
+        microsecond checks reject them up front.
+
+        Args:
+            text: Cleaned article text
+
+        Returns:
+            Reject reason string, or None if the text is worth summarizing
+        """
+        if not text or len(text) < BaseTextProcessor.MIN_ARTICLE_CHARS:
+            return 'too_short'
+
+        sample = text[:BaseTextProcessor.CHAR_DIVERSITY_WINDOW]
+        if len(set(sample)) / len(sample) < BaseTextProcessor.MIN_CHAR_DIVERSITY:
+            return 'low_entropy'
+
+        if _HTML_TAG_PATTERN.search(text):
+            return 'unstripped_html'
+
+        return None
+
+    @staticmethod
+    def _skipped_result(text: str, title: Optional[str], reason: str) -> Dict[str, Any]:
+        """
+        Build a summary-shaped result for an article rejected by _validate.
+
+        Args:
+            text: Article text (truncated into the summary slot)
+            title: Original article title
+            reason: Reject reason from _validate
+
+        Returns:
+            Dict matching generate_summary's shape plus a 'skipped' key
+        """
+        return {
+            'summary': (text or '')[:200],
+            'title': title or '',
+            'is_clickbait': False,
+            'clickbait_detected_by': None,
+            'skipped': reason
+        }
+
     @abstractmethod
     def detect_clickbait(self, title: str, text: str) -> bool:
         """
@@ -144,11 +495,53 @@ class BaseTextProcessor(ABC):
         """
         pass
 
+    def _serialize_article(self, article: Dict[str, Any]) -> bytes:
+        """
+        Serialize article_data to canonical JSON bytes.
+
+        Keys are always sorted, so the output is byte-stable regardless of
+        dict insertion order - suitable both for cache-key hashing and for
+        backends that accept structured JSON content. Uses orjson (C,
+        3-10x faster) when installed, stdlib json otherwise.
+
+        Args:
+            article: article_data dict (see summarize_article)
+
+        Returns:
+            Canonical JSON as bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(article, option=orjson.OPT_SORT_KEYS)
+        return json.dumps(article, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+    def _canonical_prompt(self, article: Dict[str, Any]) -> str:
+        """
+        Serialize article fields in canonical key order for prompt use.
+
+        Args:
+            article: article_data dict (see summarize_article)
+
+        Returns:
+            "key: value" lines in CANONICAL_KEYS order, skipping empty fields
+        """
+        schema = frozenset(key for key in self.CANONICAL_KEYS if article.get(key))
+
+        keys = self._SCHEMA_KEYS.get(schema)
+        if keys is None:
+            keys = tuple(key for key in self.CANONICAL_KEYS if key in schema)
+            self._SCHEMA_KEYS[schema] = keys
+
+        return "\n".join(f"{key}: {article[key]}" for key in keys)
+
     @abstractmethod
     def summarize_article(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Summarize an article from structured data.
 
+        Implementations that serialize the dict into a prompt must go
+        through _canonical_prompt so field ordering stays deterministic
+        across calls (prefix/KV cache friendliness).
+
         Args:
             article_data: Dict with keys:
                 - 'text': str - article text
@@ -161,3 +554,33 @@ class BaseTextProcessor(ABC):
             plus original metadata, or None on error
         """
         pass
+
+    def summarize_articles(
+        self,
+        articles: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Summarize several articles as one batch.
+
+        Default implementation overlaps the per-article summarize_article
+        calls on a thread pool (each involves multiple round-trips to the
+        AI backend); providers can override to use a native batch API.
+
+        Args:
+            articles: List of article_data dicts (see summarize_article)
+
+        Returns:
+            List of summary result dicts (None entries for failures), in
+            the same order as articles
+        """
+        if not articles:
+            return []
+
+        workers = min(len(articles), BaseAIClient.MAX_BATCH_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.summarize_article, article)
+                for article in articles
+            ]
+            return [future.result() for future in futures]
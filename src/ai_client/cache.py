@@ -0,0 +1,188 @@
+"""
+Summary response cache for the AI client layer.
+
+RSS feeds frequently re-emit identical articles (wire copy, syndication,
+overlapping runs), and each summary costs seconds of LLM decode. Caching
+results keyed by a hash of the cleaned input turns those repeats into a
+dict lookup.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils.logging_config import get_logger
+from ..config import (
+    SUMMARY_CACHE_FILE,
+    SUMMARY_CACHE_TTL,
+    VISION_CACHE_FILE,
+    VISION_CACHE_TTL
+)
+
+logger = get_logger(__name__)
+
+
+class SummaryCache:
+    """
+    Persistent cache for article summary results.
+
+    Entries are keyed by a SHA256 of the normalized (text, title, author,
+    language) tuple and expire after a TTL so stale summaries age out.
+    """
+
+    def __init__(self, cache_file=SUMMARY_CACHE_FILE, ttl_seconds=SUMMARY_CACHE_TTL):
+        """
+        Initialize summary cache.
+
+        Args:
+            cache_file: Path to JSON cache file
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+
+    @staticmethod
+    def make_key(text, title=None, author=None, language=None):
+        """
+        Build a cache key from the summarization inputs.
+
+        Args:
+            text: Cleaned article text
+            title: Article title (optional)
+            author: Article author (optional)
+            language: Summary language (optional)
+
+        Returns:
+            Hex digest string
+        """
+        normalized = {
+            'text': (text or '').strip(),
+            'title': (title or '').strip(),
+            'author': (author or '').strip(),
+            'language': language or ''
+        }
+
+        # Sorted-key JSON gives a byte-stable hash input; orjson skips the
+        # Python-level encode on the hot path when available
+        if orjson is not None:
+            payload = orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(normalized, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key):
+        """
+        Look up a cached summary result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Summary result dict, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+
+            if not entry:
+                return None
+
+            if time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+                logger.debug(f"Summary cache entry expired: {key[:12]}...")
+                del self._cache[key]
+                return None
+
+            logger.debug(f"Summary cache hit: {key[:12]}...")
+            return dict(entry['result'])
+
+    def put(self, key, result):
+        """
+        Store a summary result.
+
+        Args:
+            key: Cache key from make_key()
+            result: Summary result dict to cache
+        """
+        with self._lock:
+            self._cache[key] = {
+                'result': result,
+                'created_at': time.time()
+            }
+            self._save_cache()
+
+    def _load_cache(self):
+        """Load cache from disk, dropping entries past their TTL."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+
+                cutoff = time.time() - self.ttl_seconds
+                fresh = {
+                    key: entry for key, entry in cache.items()
+                    if entry.get('created_at', 0) >= cutoff
+                }
+
+                logger.debug(f"Loaded summary cache: {len(fresh)} fresh entries")
+                return fresh
+        except Exception as e:
+            logger.warning(f"Error loading summary cache: {e}")
+
+        return {}
+
+    def _save_cache(self):
+        """Save cache to disk atomically (write + rename)."""
+        try:
+            temp_path = self.cache_file + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+            os.replace(temp_path, self.cache_file)
+        except Exception as e:
+            logger.warning(f"Error saving summary cache: {e}")
+
+
+class VisionCache(SummaryCache):
+    """
+    Persistent cache for vision analysis results.
+
+    Same storage as SummaryCache, but keyed by a hash of the raw image
+    bytes plus the prompt - a repeat verdict on the same comic image
+    (common across feed re-runs) skips the download-encode-infer
+    round-trip entirely. Keying on image content rather than URL means
+    CDN URL variation still hits.
+    """
+
+    def __init__(self, cache_file=VISION_CACHE_FILE, ttl_seconds=VISION_CACHE_TTL):
+        """
+        Initialize vision cache.
+
+        Args:
+            cache_file: Path to JSON cache file
+            ttl_seconds: Entry lifetime in seconds
+        """
+        super().__init__(cache_file=cache_file, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def make_key(image_bytes, prompt):
+        """
+        Build a cache key from raw image bytes and a prompt.
+
+        Args:
+            image_bytes: Raw image bytes (bytes or bytearray)
+            prompt: Analysis prompt
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256(image_bytes)
+        digest.update(b'\x00')
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
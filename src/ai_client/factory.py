@@ -4,17 +4,68 @@ Factory for creating AI client and text processor instances.
 This module provides factory functions to create the appropriate AI client
 and text processor based on the configured provider (Ollama, LM Studio, etc.).
 """
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional
 from ..utils.logging_config import get_logger
 from .base import BaseAIClient, BaseTextProcessor
 
 logger = get_logger(__name__)
 
+# Resolved (client, text processor, vision processor) classes per provider,
+# so repeat factory calls skip the import machinery entirely
+_PROVIDER_CLASSES = {}
+
+
+def _provider_classes(provider):
+    """
+    Resolve the client/text/vision classes for a provider, caching the import.
+
+    Args:
+        provider: Normalized provider name
+
+    Returns:
+        Tuple of (client class, text processor class, vision processor class)
+
+    Raises:
+        ImportError: If the provider module is not available
+    """
+    cached = _PROVIDER_CLASSES.get(provider)
+    if cached is not None:
+        return cached
+
+    if provider == 'ollama':
+        from . import OllamaClient, OllamaTextClient, OllamaVisionClient
+        cached = (OllamaClient, OllamaTextClient, OllamaVisionClient)
+    elif provider in ('lm_studio', 'lmstudio'):
+        from . import LMStudioClient, LMStudioTextClient, LMStudioVisionClient
+        cached = (LMStudioClient, LMStudioTextClient, LMStudioVisionClient)
+    elif provider == 'openai':
+        from . import OpenAIClient, OpenAITextProcessor, OpenAIVisionProcessor
+        cached = (OpenAIClient, OpenAITextProcessor, OpenAIVisionProcessor)
+    elif provider == 'gemini':
+        from . import GeminiClient, GeminiTextClient, GeminiVisionClient
+        cached = (GeminiClient, GeminiTextClient, GeminiVisionClient)
+    elif provider in ('claude', 'anthropic'):
+        from . import ClaudeClient, ClaudeTextClient, ClaudeVisionClient
+        cached = (ClaudeClient, ClaudeTextClient, ClaudeVisionClient)
+    else:
+        raise ImportError(f"Unknown AI provider: {provider}")
+
+    _PROVIDER_CLASSES[provider] = cached
+    return cached
 
+
+@lru_cache(maxsize=1)
 def _load_user_config():
     """
     Load user configuration from .config.json if it exists.
 
+    Memoized: the factory (and its fallback path) may run several times
+    per process and the file does not change mid-run.
+
     Returns:
         Configuration dictionary or None if file doesn't exist
     """
@@ -29,205 +80,182 @@ def _load_user_config():
         return None
 
 
-def create_ai_client() -> Tuple[BaseAIClient, BaseTextProcessor, Optional[object]]:
+def _configured_provider(user_config, config):
     """
-    Create AI client, text processor, and vision processor instances based on configured provider.
+    Resolve the provider name, preferring .config.json over config.py.
 
-    Returns:
-        Tuple of (BaseAIClient, BaseTextProcessor, VisionProcessor) instances
-        VisionProcessor may be None if not available for the provider
+    Shared by create_ai_client and the fallback path so the precedence
+    rule lives in exactly one place.
 
-    Raises:
-        ValueError: If configured provider is unknown
-        ImportError: If provider module is not available
-    """
-    # Load user configuration from .config.json if it exists
-    user_config = _load_user_config()
-
-    # Import default config
-    from .. import config
+    Args:
+        user_config: Parsed .config.json dict or None
+        config: The src.config module
 
-    # Determine provider: user config takes precedence, then config.py
+    Returns:
+        Lowercased provider name
+    """
     if user_config and 'ai_provider' in user_config:
-        provider = user_config['ai_provider'].lower()
-        logger.info(f"Using AI provider from .config.json: {provider}")
-    else:
-        provider = config.AI_PROVIDER.lower()
-        logger.info(f"Using AI provider from config.py: {provider}")
-
-    if provider == 'ollama':
-        try:
-            from ..ollama_client.client import OllamaClient
-            from ..ollama_client.text_processor import OllamaTextClient
-            from ..ollama_client.vision_processor import OllamaVisionClient
-
-            # Get Ollama configuration from user config or defaults
-            ollama_base_url = config.OLLAMA_BASE_URL
-            text_model = config.TEXT_MODEL
-            vision_model = config.VISION_MODEL
-
-            if user_config:
-                ollama_base_url = user_config.get('ollama_base_url', ollama_base_url)
-                text_model = user_config.get('text_model', text_model)
-                vision_model = user_config.get('vision_model', vision_model)
+        return user_config['ai_provider'].lower()
+    return config.AI_PROVIDER.lower()
+
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """Everything create_ai_client needs to build one provider."""
+    name: str                                # canonical name for _provider_classes
+    label: str                               # human-readable name for log lines
+    text_model_attr: str                     # config attr holding the text model
+    base_url_attr: Optional[str] = None      # config attr (local providers only)
+    api_key_attr: Optional[str] = None       # config attr (cloud providers only)
+    vision_model_attr: Optional[str] = None  # None = vision reuses the text model
+    user_url_key: Optional[str] = None       # .config.json key for the base URL
+    user_key_keys: Tuple[str, ...] = ()      # .config.json keys for the API key, in priority order
+    api_key_help: Optional[str] = None       # user-facing message when the key is missing
+
+
+_PROVIDERS = {
+    'ollama': ProviderSpec(
+        name='ollama',
+        label='Ollama',
+        text_model_attr='TEXT_MODEL',
+        base_url_attr='OLLAMA_BASE_URL',
+        vision_model_attr='VISION_MODEL',
+        user_url_key='ollama_base_url',
+    ),
+    'lm_studio': ProviderSpec(
+        name='lm_studio',
+        label='LM Studio',
+        text_model_attr='LM_STUDIO_TEXT_MODEL',
+        base_url_attr='LM_STUDIO_BASE_URL',
+        user_url_key='lm_studio_base_url',
+    ),
+    'openai': ProviderSpec(
+        name='openai',
+        label='OpenAI',
+        text_model_attr='OPENAI_TEXT_MODEL',
+        api_key_attr='OPENAI_API_KEY',
+        vision_model_attr='OPENAI_VISION_MODEL',
+        user_key_keys=('openai_api_key',),
+        api_key_help=(
+            "OpenAI provider requires API key. Please set OPENAI_API_KEY environment variable. "
+            "Get your API key from: https://platform.openai.com/api-keys"
+        ),
+    ),
+    'gemini': ProviderSpec(
+        name='gemini',
+        label='Gemini',
+        text_model_attr='GEMINI_TEXT_MODEL',
+        api_key_attr='GEMINI_API_KEY',
+        vision_model_attr='GEMINI_VISION_MODEL',
+        user_key_keys=('gemini_api_key',),
+        api_key_help=(
+            "Gemini provider requires API key. Please set GEMINI_API_KEY or GOOGLE_API_KEY environment variable. "
+            "Get your API key from: https://aistudio.google.com/app/apikey"
+        ),
+    ),
+    'claude': ProviderSpec(
+        name='claude',
+        label='Claude',
+        text_model_attr='CLAUDE_TEXT_MODEL',
+        api_key_attr='ANTHROPIC_API_KEY',
+        vision_model_attr='CLAUDE_VISION_MODEL',
+        user_key_keys=('claude_api_key', 'anthropic_api_key'),
+        api_key_help=(
+            "Claude provider requires API key. Please set ANTHROPIC_API_KEY environment variable. "
+            "Get your API key from: https://console.anthropic.com/"
+        ),
+    ),
+}
+
+# Aliases accepted in config
+_PROVIDERS['lmstudio'] = _PROVIDERS['lm_studio']
+_PROVIDERS['anthropic'] = _PROVIDERS['claude']
+
+
+def _instantiate(spec, user_config, config):
+    """
+    Build (client, text processor, vision processor) from a ProviderSpec.
 
-            logger.info(f"Ollama config - URL: {ollama_base_url}, Text: {text_model}, Vision: {vision_model}")
+    Args:
+        spec: ProviderSpec for the chosen provider
+        user_config: Dict from .config.json, or None
+        config: The src.config module
 
-            client = OllamaClient(base_url=ollama_base_url)
-            text_processor = OllamaTextClient(model=text_model, base_url=ollama_base_url)
-            vision_processor = OllamaVisionClient(model=vision_model, base_url=ollama_base_url) if vision_model else None
+    Returns:
+        Tuple of (client, text processor, vision processor) instances
 
-            logger.info("Ollama client initialized successfully with vision support")
-            return client, text_processor, vision_processor
+    Raises:
+        ValueError: If a required API key is missing
+        ImportError: If the provider module is not available
+    """
+    client_cls, text_cls, vision_cls = _provider_classes(spec.name)
+
+    text_model = getattr(config, spec.text_model_attr)
+    vision_model = getattr(config, spec.vision_model_attr) if spec.vision_model_attr else None
+    if user_config:
+        text_model = user_config.get('text_model', text_model)
+        if spec.vision_model_attr:
+            vision_model = user_config.get('vision_model', vision_model)
+    if not spec.vision_model_attr:
+        # Providers like LM Studio serve text and vision from one model
+        vision_model = text_model
+
+    if spec.base_url_attr:
+        base_url = getattr(config, spec.base_url_attr)
+        if user_config and spec.user_url_key:
+            base_url = user_config.get(spec.user_url_key, base_url)
+
+        logger.info(f"{spec.label} config - URL: {base_url}, Text: {text_model}, Vision: {vision_model}")
+
+        client = client_cls(base_url=base_url)
+        text_processor = text_cls(model=text_model, base_url=base_url)
+        vision_processor = vision_cls(model=vision_model, base_url=base_url) if vision_model else None
+    else:
+        api_key = getattr(config, spec.api_key_attr)
+        if user_config:
+            for key in spec.user_key_keys:
+                if key in user_config:
+                    api_key = user_config[key]
+                    break
 
-        except ImportError as e:
-            logger.error(f"Failed to import Ollama client: {e}")
-            raise ImportError(f"Ollama client not available: {e}")
+        if not api_key:
+            raise ValueError(f"{spec.label} API key not found")
 
-    elif provider == 'lm_studio' or provider == 'lmstudio':
-        try:
-            from ..lm_studio_client.client import LMStudioClient
-            from ..lm_studio_client.text_processor import LMStudioTextClient
-            from ..lm_studio_client.vision_processor import LMStudioVisionClient
+        logger.info(f"{spec.label} config - Text: {text_model}, Vision: {vision_model}")
 
-            # Get LM Studio configuration from user config or defaults
-            lm_studio_base_url = config.LM_STUDIO_BASE_URL
-            lm_studio_model = config.LM_STUDIO_TEXT_MODEL
+        client = client_cls(api_key=api_key)
+        text_processor = text_cls(model=text_model, api_key=api_key)
+        vision_processor = vision_cls(model=vision_model, api_key=api_key)
 
-            if user_config:
-                lm_studio_base_url = user_config.get('lm_studio_base_url', lm_studio_base_url)
-                # LM Studio uses same model for both text and vision
-                lm_studio_model = user_config.get('text_model', lm_studio_model)
+    logger.info(f"{spec.label} client initialized successfully with vision support")
+    return client, text_processor, vision_processor
 
-            logger.info(f"LM Studio config - URL: {lm_studio_base_url}, Model: {lm_studio_model}")
 
-            client = LMStudioClient(base_url=lm_studio_base_url)
-            text_processor = LMStudioTextClient(model=lm_studio_model, base_url=lm_studio_base_url)
-            vision_processor = LMStudioVisionClient(model=lm_studio_model, base_url=lm_studio_base_url)
+def create_ai_client() -> Tuple[BaseAIClient, BaseTextProcessor, Optional[object]]:
+    """
+    Create AI client, text processor, and vision processor instances based on configured provider.
 
-            logger.info("LM Studio client initialized successfully with vision support")
-            return client, text_processor, vision_processor
+    Returns:
+        Tuple of (BaseAIClient, BaseTextProcessor, VisionProcessor) instances
+        VisionProcessor may be None if not available for the provider
 
-        except ImportError as e:
-            logger.error(f"Failed to import LM Studio client: {e}")
-            raise ImportError(f"LM Studio client not available: {e}")
+    Raises:
+        ValueError: If configured provider is unknown or misconfigured
+        ImportError: If provider module is not available
+    """
+    # Load user configuration from .config.json if it exists
+    user_config = _load_user_config()
 
-    elif provider == 'openai':
-        try:
-            from ..openai_provider.client import OpenAIClient
-            from ..openai_provider.text_processor import OpenAITextProcessor
-            from ..openai_provider.vision_processor import OpenAIVisionProcessor
-
-            # Get OpenAI configuration from user config or defaults
-            openai_api_key = config.OPENAI_API_KEY
-            openai_text_model = config.OPENAI_TEXT_MODEL
-            openai_vision_model = config.OPENAI_VISION_MODEL
-
-            if user_config:
-                openai_api_key = user_config.get('openai_api_key', openai_api_key)
-                openai_text_model = user_config.get('text_model', openai_text_model)
-                openai_vision_model = user_config.get('vision_model', openai_vision_model)
-
-            logger.info(f"OpenAI config - Text: {openai_text_model}, Vision: {openai_vision_model}")
-
-            client = OpenAIClient(api_key=openai_api_key)
-            text_processor = OpenAITextProcessor(model=openai_text_model, api_key=openai_api_key)
-            vision_processor = OpenAIVisionProcessor(model=openai_vision_model, api_key=openai_api_key)
-
-            logger.info("OpenAI client initialized successfully with vision support")
-            return client, text_processor, vision_processor
-
-        except ValueError as e:
-            # API key not found - provide helpful error message
-            logger.error(f"Failed to initialize OpenAI client: {e}")
-            error_msg = (
-                "OpenAI provider requires API key. Please set OPENAI_API_KEY environment variable. "
-                "Get your API key from: https://platform.openai.com/api-keys"
-            )
-            raise ValueError(error_msg)
-        except ImportError as e:
-            logger.error(f"Failed to import OpenAI client: {e}")
-            raise ImportError(f"OpenAI client not available: {e}")
+    # Import default config
+    from .. import config
 
-    elif provider == 'gemini':
-        try:
-            from ..gemini_provider.client import GeminiClient
-            from ..gemini_provider.text_processor import GeminiTextClient
-            from ..gemini_provider.vision_processor import GeminiVisionClient
-
-            # Get Gemini configuration from user config or defaults
-            gemini_api_key = config.GEMINI_API_KEY
-            gemini_text_model = config.GEMINI_TEXT_MODEL
-            gemini_vision_model = config.GEMINI_VISION_MODEL
-
-            if user_config:
-                gemini_api_key = user_config.get('gemini_api_key', gemini_api_key)
-                gemini_text_model = user_config.get('text_model', gemini_text_model)
-                gemini_vision_model = user_config.get('vision_model', gemini_vision_model)
-
-            if not gemini_api_key:
-                raise ValueError("Gemini API key not found")
-
-            logger.info(f"Gemini config - Text: {gemini_text_model}, Vision: {gemini_vision_model}")
-
-            client = GeminiClient(api_key=gemini_api_key)
-            text_processor = GeminiTextClient(api_key=gemini_api_key, model=gemini_text_model)
-            vision_processor = GeminiVisionClient(api_key=gemini_api_key, model=gemini_vision_model)
-
-            logger.info("Gemini client initialized successfully with vision support")
-            return client, text_processor, vision_processor
-
-        except ValueError as e:
-            logger.error(f"Failed to initialize Gemini client: {e}")
-            error_msg = (
-                "Gemini provider requires API key. Please set GEMINI_API_KEY or GOOGLE_API_KEY environment variable. "
-                "Get your API key from: https://aistudio.google.com/app/apikey"
-            )
-            raise ValueError(error_msg)
-        except ImportError as e:
-            logger.error(f"Failed to import Gemini client: {e}")
-            raise ImportError(f"Gemini client not available: {e}")
-
-    elif provider == 'claude' or provider == 'anthropic':
-        try:
-            from ..claude_provider.client import ClaudeClient
-            from ..claude_provider.text_processor import ClaudeTextClient
-            from ..claude_provider.vision_processor import ClaudeVisionClient
-
-            # Get Claude configuration from user config or defaults
-            anthropic_api_key = config.ANTHROPIC_API_KEY
-            claude_text_model = config.CLAUDE_TEXT_MODEL
-            claude_vision_model = config.CLAUDE_VISION_MODEL
-
-            if user_config:
-                anthropic_api_key = user_config.get('claude_api_key', user_config.get('anthropic_api_key', anthropic_api_key))
-                claude_text_model = user_config.get('text_model', claude_text_model)
-                claude_vision_model = user_config.get('vision_model', claude_vision_model)
-
-            if not anthropic_api_key:
-                raise ValueError("Anthropic API key not found")
-
-            logger.info(f"Claude config - Text: {claude_text_model}, Vision: {claude_vision_model}")
-
-            client = ClaudeClient(api_key=anthropic_api_key)
-            text_processor = ClaudeTextClient(api_key=anthropic_api_key, model=claude_text_model)
-            vision_processor = ClaudeVisionClient(api_key=anthropic_api_key, model=claude_vision_model)
-
-            logger.info("Claude client initialized successfully with vision support")
-            return client, text_processor, vision_processor
-
-        except ValueError as e:
-            logger.error(f"Failed to initialize Claude client: {e}")
-            error_msg = (
-                "Claude provider requires API key. Please set ANTHROPIC_API_KEY environment variable. "
-                "Get your API key from: https://console.anthropic.com/"
-            )
-            raise ValueError(error_msg)
-        except ImportError as e:
-            logger.error(f"Failed to import Claude client: {e}")
-            raise ImportError(f"Claude client not available: {e}")
+    # Determine provider: user config takes precedence, then config.py
+    provider = _configured_provider(user_config, config)
+    source = '.config.json' if user_config and 'ai_provider' in user_config else 'config.py'
+    logger.info(f"Using AI provider from {source}: {provider}")
 
-    else:
+    spec = _PROVIDERS.get(provider)
+    if spec is None:
         error_msg = (
             f"Unknown AI provider: {provider}. "
             f"Supported providers: 'ollama', 'lm_studio', 'openai', 'gemini', 'claude'"
@@ -235,14 +263,29 @@ def create_ai_client() -> Tuple[BaseAIClient, BaseTextProcessor, Optional[object
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-
-def create_ai_client_with_fallback() -> Tuple[BaseAIClient, BaseTextProcessor, Optional[object]]:
+    try:
+        return _instantiate(spec, user_config, config)
+    except ValueError as e:
+        logger.error(f"Failed to initialize {spec.label} client: {e}")
+        if spec.api_key_help:
+            raise ValueError(spec.api_key_help)
+        raise
+    except ImportError as e:
+        logger.error(f"Failed to import {spec.label} client: {e}")
+        raise ImportError(f"{spec.label} client not available: {e}")
+
+
+def create_ai_client_with_fallback(microbatch: bool = False) -> Tuple[BaseAIClient, BaseTextProcessor, Optional[object]]:
     """
     Create AI client with fallback to Ollama if configured provider fails.
 
     This function attempts to create the configured provider, and if that fails,
     falls back to Ollama as the default provider.
 
+    Args:
+        microbatch: Wrap the client so concurrent generate() calls arriving
+            within a short window coalesce into one batched dispatch
+
     Returns:
         Tuple of (BaseAIClient, BaseTextProcessor, VisionProcessor) instances
         VisionProcessor may be None if not available
@@ -250,24 +293,31 @@ def create_ai_client_with_fallback() -> Tuple[BaseAIClient, BaseTextProcessor, O
     Raises:
         ImportError: If all providers fail to initialize
     """
+    client, text_processor, vision_processor = _create_with_fallback()
+
+    if microbatch:
+        from .microbatch import MicrobatchingClient
+        client = MicrobatchingClient(client)
+
+    return client, text_processor, vision_processor
+
+
+def _create_with_fallback() -> Tuple[BaseAIClient, BaseTextProcessor, Optional[object]]:
+    """Build the configured provider, falling back to Ollama on failure."""
     try:
         return create_ai_client()
     except (ValueError, ImportError) as e:
         logger.warning(f"Failed to create configured AI client: {e}")
 
-        # Load user config and check provider
-        user_config = _load_user_config()
+        # Determine what provider was attempted; _load_user_config is
+        # memoized, so this does not re-read .config.json
         from .. import config
-
-        # Determine what provider was attempted
-        attempted_provider = user_config.get('ai_provider', config.AI_PROVIDER).lower() if user_config else config.AI_PROVIDER.lower()
+        attempted_provider = _configured_provider(_load_user_config(), config)
 
         if attempted_provider != 'ollama':
             logger.info("Falling back to Ollama provider")
             try:
-                from ..ollama_client.client import OllamaClient
-                from ..ollama_client.text_processor import OllamaTextClient
-                from ..ollama_client.vision_processor import OllamaVisionClient
+                OllamaClient, OllamaTextClient, OllamaVisionClient = _provider_classes('ollama')
 
                 # Get Ollama configuration from defaults (fallback mode)
                 ollama_base_url = config.OLLAMA_BASE_URL
@@ -4,15 +4,38 @@ Anthropic Claude API client for RSS Feed Processor
 This module provides integration with Anthropic's Claude API using the
 Messages API format.
 """
+import json
+
 import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from typing import Optional, List, Dict, Any
 from ..utils.logging_config import get_logger
+from ..utils.image_utils import encode_image_bytes
 from ..config import REQUEST_TIMEOUT
 from ..ai_client.base import BaseAIClient
 
 logger = get_logger(__name__)
 
 
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request body to JSON bytes.
+
+    Vision payloads carry a multi-MB base64 string, where orjson's C
+    encoder is several times faster than the stdlib; fall back to json
+    when it isn't installed. Posting pre-encoded bytes also bypasses the
+    encode requests would otherwise do internally.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
 class ClaudeClient(BaseAIClient):
     """
     Client for interacting with Anthropic Claude API.
@@ -33,6 +56,7 @@ class ClaudeClient(BaseAIClient):
         if not api_key:
             raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY environment variable.")
 
+        super().__init__()
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
 
@@ -62,7 +86,7 @@ class ClaudeClient(BaseAIClient):
                 "messages": [{"role": "user", "content": "Hi"}]
             }
 
-            response = requests.post(url, headers=headers, json=payload, timeout=5)
+            response = self._session.post(url, headers=headers, data=_encode_payload(payload), timeout=5)
 
             # 200 or 400 means API is accessible (400 just means invalid request format)
             if response.status_code in [200, 400]:
@@ -131,7 +155,7 @@ class ClaudeClient(BaseAIClient):
             if system:
                 payload["system"] = system
 
-            response = requests.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+            response = self._session.post(url, headers=headers, data=_encode_payload(payload), timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -196,7 +220,7 @@ class ClaudeClient(BaseAIClient):
             if system_prompt:
                 payload["system"] = system_prompt
 
-            response = requests.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+            response = self._session.post(url, headers=headers, data=_encode_payload(payload), timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -214,6 +238,41 @@ class ClaudeClient(BaseAIClient):
                 logger.error(f"Response: {e.response.text}")
             return None
 
+    def generate_with_image_bytes(self, prompt: str, image_bytes: bytes,
+                                  mime_type: str = "image/jpeg",
+                                  system: Optional[str] = None,
+                                  temperature: float = 0.1,
+                                  model: Optional[str] = None,
+                                  max_tokens: int = 2048) -> Optional[str]:
+        """
+        Generate text from raw image bytes and a prompt.
+
+        Callers hand over the bytes they already hold and the base64
+        encode happens exactly once here, right before the payload is
+        built - no encoded-string copies travel through the call chain.
+
+        Args:
+            prompt: Text prompt
+            image_bytes: Raw image bytes
+            mime_type: Media type of the image
+            system: System instructions (optional)
+            temperature: Temperature for generation
+            model: Model to use (required)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text or None on error
+        """
+        return self.generate_with_image(
+            prompt=prompt,
+            image_data=encode_image_bytes(image_bytes),
+            system=system,
+            temperature=temperature,
+            model=model,
+            max_tokens=max_tokens,
+            media_type=mime_type
+        )
+
     def generate_with_image(self, prompt: str, image_data: str,
                            system: Optional[str] = None, temperature: float = 0.1,
                            model: Optional[str] = None, max_tokens: int = 2048,
@@ -270,7 +329,7 @@ class ClaudeClient(BaseAIClient):
             if system:
                 payload["system"] = system
 
-            response = requests.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT * 2)
+            response = self._session.post(url, headers=headers, data=_encode_payload(payload), timeout=REQUEST_TIMEOUT * 2)
             response.raise_for_status()
 
             data = response.json()
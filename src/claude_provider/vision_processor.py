@@ -3,19 +3,74 @@ Vision processing with Anthropic Claude for RSS Feed Processor
 
 This module provides image analysis using Anthropic's Claude vision capabilities.
 """
-import base64
-import requests
-from pathlib import Path
-from typing import Optional
-from PIL import Image
-from io import BytesIO
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
 from .client import ClaudeClient
+from ..ai_client.cache import VisionCache
+from ..utils.image_utils import downscale_for_vision, mime_for_suffix
+from ..utils.http_client import get_shared_session
 from ..utils.logging_config import get_logger
 from ..config import CLAUDE_VISION_MODEL, VISION_TEMPERATURE
 
 logger = get_logger(__name__)
 
 
+def _is_yes(result: Optional[str]) -> bool:
+    """
+    Interpret a yes/no vision verdict.
+
+    Models answer "Yes.", "yes\\n" or "Yes, it does" about as often as a
+    bare "yes"; a prefix check accepts all of those with a single small
+    slice instead of strip+lower over the whole reply.
+    """
+    return bool(result) and result.lstrip()[:3].lower() == 'yes'
+
+
+# Local comic validation thresholds: anything smaller than a thumbnail is
+# an obvious reject, anything this large with a sane aspect ratio is an
+# obvious accept - only the grey zone pays for an API round-trip
+_MIN_COMIC_DIMENSION = 200  # pixels
+_MIN_COMIC_FILE_SIZE = 4 * 1024  # bytes
+_LARGE_COMIC_FILE_SIZE = 500 * 1024  # bytes
+
+
+def _local_comic_verdict(image_path: str) -> Optional[bool]:
+    """
+    Cheap local verdict on whether a file looks like a real comic image.
+
+    Reads only the file size and the image header (PIL never decodes
+    pixels for .size), so this costs microseconds against the seconds of
+    a vision API call.
+
+    Args:
+        image_path: Path to a local image file
+
+    Returns:
+        True/False when the answer is obvious, None when unsure
+    """
+    try:
+        file_size = os.path.getsize(image_path)
+        if file_size < _MIN_COMIC_FILE_SIZE:
+            return False
+
+        from PIL import Image  # deferred: keep module import light
+
+        with Image.open(image_path) as img:
+            width, height = img.size
+
+        if width < _MIN_COMIC_DIMENSION or height < _MIN_COMIC_DIMENSION:
+            return False
+
+        if file_size > _LARGE_COMIC_FILE_SIZE and 0.2 <= width / height <= 5:
+            return True
+
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
 class ClaudeVisionClient:
     """
     Vision processor using Anthropic Claude for image analysis.
@@ -33,66 +88,80 @@ class ClaudeVisionClient:
         """
         self.client = ClaudeClient(api_key=api_key)
         self.model = model
+        self._cache = VisionCache()
+        # Bound once: analyze_images fans analyze_image out over a thread
+        # pool, so per-call module/attribute lookups repeat per image
+        self._temperature = VISION_TEMPERATURE
+        self._generate = self.client.generate_with_image_bytes
 
-    def encode_image_from_file(self, image_path: str) -> Optional[tuple[str, str]]:
+    def encode_image_from_file(self, image_path: str) -> Optional[tuple[bytes, str]]:
         """
-        Encode an image file to base64.
+        Read and prepare an image file for a vision request.
 
         Args:
             image_path: Path to image file
 
         Returns:
-            Tuple of (base64_data, mime_type) or None on error
+            Tuple of (image_bytes, mime_type) or None on error
         """
         try:
-            path = Path(image_path)
-            if not path.exists():
-                logger.error(f"Image file not found: {image_path}")
-                return None
-
-            # Determine MIME type from extension
-            ext = path.suffix.lower()
-            mime_types = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }
-            mime_type = mime_types.get(ext, 'image/jpeg')
-
-            # Read and encode image
+            # Determine MIME type from extension; rpartition avoids
+            # building a Path object just to read the suffix
+            _, sep, ext = image_path.rpartition('.')
+            mime_type = mime_for_suffix(ext) if sep else 'image/jpeg'
+
+            # Read, downscale, and encode image. No exists() probe first:
+            # open() already stats the path, and a missing file lands in
+            # the FileNotFoundError branch below
             with open(image_path, 'rb') as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+                raw_data = image_file.read()
+
+            image_bytes, vision_mime = downscale_for_vision(raw_data)
+            if image_bytes is not raw_data:
+                mime_type = vision_mime  # re-encoded as JPEG
 
-            return image_data, mime_type
+            return image_bytes, mime_type
 
+        except FileNotFoundError:
+            logger.error(f"Image file not found: {image_path}")
+            return None
         except Exception as e:
             logger.error(f"Error encoding image from file: {e}")
             return None
 
-    def encode_image_from_url(self, image_url: str) -> Optional[tuple[str, str]]:
+    def encode_image_from_url(self, image_url: str) -> Optional[tuple[bytes, str]]:
         """
-        Download and encode an image from URL.
+        Download and prepare an image from URL for a vision request.
 
         Args:
             image_url: URL of the image
 
         Returns:
-            Tuple of (base64_data, mime_type) or None on error
+            Tuple of (image_bytes, mime_type) or None on error
         """
         try:
-            response = requests.get(image_url, timeout=30)
+            # Shared pooled session: keep-alive avoids a TCP/TLS
+            # handshake per image when a feed serves several pages
+            response = get_shared_session().get(image_url, timeout=30, stream=True)
             response.raise_for_status()
 
             # Get MIME type from response headers
             content_type = response.headers.get('content-type', 'image/jpeg')
             mime_type = content_type.split(';')[0].strip()
 
-            # Encode image data
-            image_data = base64.b64encode(response.content).decode('utf-8')
+            # Stream the body into one growable buffer instead of having
+            # .content join an internal chunk list into a second full-size
+            # bytes object - lower peak allocation on multi-MB comics
+            raw_data = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                raw_data.extend(chunk)
 
-            return image_data, mime_type
+            # Downscale and encode image data
+            image_bytes, vision_mime = downscale_for_vision(raw_data)
+            if image_bytes is not raw_data:
+                mime_type = vision_mime  # re-encoded as JPEG
+
+            return image_bytes, mime_type
 
         except Exception as e:
             logger.error(f"Error encoding image from URL: {e}")
@@ -122,23 +191,65 @@ class ClaudeVisionClient:
             logger.error("Failed to encode image")
             return None
 
-        image_data, mime_type = encoded
+        image_bytes, mime_type = encoded
+
+        # Keyed on image content + prompt: a repeat verdict on the same
+        # comic skips the paid inference round-trip
+        cache_key = VisionCache.make_key(image_bytes, prompt)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached['analysis']
 
         try:
-            result = self.client.generate_with_image(
+            result = self._generate(
                 prompt=prompt,
-                image_data=image_data,
-                temperature=VISION_TEMPERATURE,
-                model=model,
-                mime_type=mime_type
+                image_bytes=image_bytes,
+                mime_type=mime_type,
+                temperature=self._temperature,
+                model=model
             )
 
+            if result:
+                self._cache.put(cache_key, {'analysis': result})
+
             return result
 
         except Exception as e:
             logger.error(f"Error analyzing image: {e}")
             return None
 
+    def analyze_images(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Analyze several images as one batch.
+
+        Each analysis is an independent network round-trip to the API, so
+        the calls fan out over a thread pool and overlap instead of
+        serializing on RTT.
+
+        Args:
+            items: List of (image_path_or_url, prompt) tuples
+            max_workers: Cap on concurrent requests
+
+        Returns:
+            List of analysis results (None entries for failures), in the
+            same order as items
+        """
+        if not items:
+            return []
+
+        workers = min(len(items), max_workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.analyze_image, image_path, prompt)
+                for image_path, prompt in items
+            ]
+            return [future.result() for future in futures]
+
     def detect_oglaf_pages(self, image_url: str) -> bool:
         """
         Detect if an Oglaf comic has multiple pages.
@@ -157,10 +268,7 @@ class ClaudeVisionClient:
 
         result = self.analyze_image(image_url, prompt)
 
-        if result:
-            return result.strip().lower() == 'yes'
-
-        return False
+        return _is_yes(result)
 
     def validate_comic_image(self, image_path: str) -> bool:
         """
@@ -172,6 +280,13 @@ class ClaudeVisionClient:
         Returns:
             True if image appears to be a valid comic, False otherwise
         """
+        # Obvious thumbnails and obvious full-size comics never reach the
+        # API; only ambiguous files pay for a remote verdict
+        verdict = _local_comic_verdict(image_path)
+        if verdict is not None:
+            logger.debug(f"Local verdict for {image_path}: {verdict}")
+            return verdict
+
         prompt = (
             "Is this a full comic strip or panel? (not a thumbnail, not an error page, "
             "not a 'comic not found' message). Answer with only 'yes' or 'no'."
@@ -179,10 +294,7 @@ class ClaudeVisionClient:
 
         result = self.analyze_image(image_path, prompt)
 
-        if result:
-            return result.strip().lower() == 'yes'
-
-        return False
+        return _is_yes(result)
 
     def describe_image(self, image_path: str) -> Optional[str]:
         """
@@ -1,30 +1,62 @@
 """
 Comic downloader for RSS Feed Processor
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from PIL import Image
 from .extractors import get_extractor
 from ..utils.logging_config import get_logger
+from ..config import MAX_CONCURRENT_FEEDS
 from ..ollama_client.vision_processor import OllamaVisionClient
 
 logger = get_logger(__name__)
 
+# Magic-byte signatures for the supported image formats - enough to
+# reject HTML error pages saved as images without decoding any pixels
+_IMAGE_MAGIC = (
+    b'\xff\xd8\xff',        # JPEG
+    b'\x89PNG\r\n\x1a\n',   # PNG
+    b'GIF87a',              # GIF
+    b'GIF89a',
+)
+
+
+def _has_image_magic(image_path):
+    """Check the file header against known image signatures."""
+    try:
+        with open(image_path, 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return False
+
+    if header.startswith(_IMAGE_MAGIC):
+        return True
+
+    # WEBP: RIFF container with a positional format tag
+    return header[:4] == b'RIFF' and header[8:12] == b'WEBP'
+
 
 class ComicDownloader:
     """
     Downloads and validates comic images.
     """
 
-    def __init__(self, validate_images=False, use_vision=True):
+    def __init__(self, validate_images=False, use_vision=True,
+                 max_workers=MAX_CONCURRENT_FEEDS, verify_mode='magic'):
         """
         Initialize comic downloader.
 
         Args:
             validate_images: Whether to validate images with vision model
             use_vision: Whether to use vision model for Oglaf multi-page detection
+            max_workers: Concurrent feed downloads in batch_download
+            verify_mode: 'magic' checks file signatures only (reads 16
+                bytes); 'full' decodes with PIL to also catch truncation
         """
         self.validate_images = validate_images
         self.use_vision = use_vision
+        self.max_workers = max_workers
+        self.verify_mode = verify_mode
         self.vision_client = OllamaVisionClient() if validate_images else None
 
     def download_comic(self, feed_data, output_dir):
@@ -49,6 +81,16 @@ class ComicDownloader:
             downloaded_files = extractor.download_images(output_dir)
 
             if not downloaded_files:
+                if extractor.skip_reason:
+                    # Deliberate pass (e.g. a news post in a mixed feed),
+                    # not a failure - don't alarm the logs over it
+                    logger.info(f"Skipped {feed_name}: {extractor.skip_reason}")
+                    return {
+                        'success': False,
+                        'feed_name': feed_name,
+                        'skipped': extractor.skip_reason
+                    }
+
                 logger.warning(f"No images downloaded for {feed_name}")
                 return {
                     'success': False,
@@ -85,54 +127,73 @@ class ComicDownloader:
                 'error': str(e)
             }
 
+    # Each validation is an independent vision-model round-trip, so a
+    # small pool overlaps the waits without flooding the model server
+    MAX_VALIDATION_WORKERS = 4
+
     def _validate_images(self, image_paths):
         """
-        Validate downloaded images.
+        Validate downloaded images, overlapping the vision calls.
 
         Args:
             image_paths: List of image file paths
 
         Returns:
-            List of validation results
+            List of validation results, in input order
         """
         if not self.vision_client:
             return None
 
-        results = []
+        if not image_paths:
+            return []
 
-        for image_path in image_paths:
+        def validate_one(image_path):
             try:
                 # Basic validation (format, size)
                 validation = self.vision_client.validate_comic_image(image_path)
-                results.append({
+                return {
                     'path': image_path,
                     'valid': validation['valid'],
                     'is_comic': validation.get('is_comic', False),
                     'format': validation.get('format'),
                     'size': validation.get('size'),
                     'reason': validation.get('reason')
-                })
+                }
 
             except Exception as e:
                 logger.error(f"Error validating image {image_path}: {e}")
-                results.append({
+                return {
                     'path': image_path,
                     'valid': False,
                     'error': str(e)
-                })
+                }
 
-        return results
+        workers = min(len(image_paths), self.MAX_VALIDATION_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(validate_one, image_paths))
 
     def verify_image_format(self, image_path):
         """
         Verify image is in a valid format.
 
+        In 'magic' mode (default) only the file signature is checked -
+        16 bytes of IO, no PIL decode. 'full' mode keeps the old
+        Image.verify() pass, which also catches truncated files.
+
         Args:
             image_path: Path to image file
 
         Returns:
             True if valid, False otherwise
         """
+        if self.verify_mode == 'magic':
+            if _has_image_magic(image_path):
+                return True
+
+            logger.error(f"Invalid image format for {image_path}: unrecognized signature")
+            return False
+
         try:
             with Image.open(image_path) as img:
                 # Try to verify the image
@@ -154,26 +215,55 @@ class ComicDownloader:
         Returns:
             List of download results
         """
-        results = []
-
-        for feed_data in comic_feeds:
-            # Comics should only have 1 entry (latest), but handle entries list
-            entries = feed_data.get('entries', [])
-            if entries:
-                # Create single-entry feed_data for download_comic
-                single_entry_data = {
-                    **feed_data,
-                    'entry': entries[0]  # Use first (and only) entry
-                }
-                result = self.download_comic(single_entry_data, output_dir)
-                results.append(result)
-            else:
-                logger.warning(f"No entries for {feed_data.get('feed_name', 'Unknown')}")
+        # Download comics concurrently - each feed is an independent I/O-bound
+        # pipeline, so a slow host doesn't stall the others. Results keep
+        # the input feed order regardless of completion order.
+        ordered = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_index = {}
+
+            for index, feed_data in enumerate(comic_feeds):
+                # Comics should only have 1 entry (latest), but handle entries list
+                entries = feed_data.get('entries', [])
+                if entries:
+                    # Create single-entry feed_data for download_comic,
+                    # carrying only the keys the downloader and extractors
+                    # actually read - no point cloning the whole feed dict
+                    # (entries list included) per feed
+                    single_entry_data = {
+                        'feed_name': feed_data.get('feed_name', 'Unknown'),
+                        'session': feed_data.get('session'),
+                        'special_handler': feed_data.get('special_handler'),
+                        'entry': entries[0]  # Use first (and only) entry
+                    }
+                    future = executor.submit(self.download_comic, single_entry_data, output_dir)
+                    future_to_index[future] = index
+                else:
+                    logger.warning(f"No entries for {feed_data.get('feed_name', 'Unknown')}")
+
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                feed_data = comic_feeds[index]
+
+                try:
+                    ordered[index] = future.result()
+                except Exception as e:
+                    feed_name = feed_data.get('feed_name', 'Unknown')
+                    logger.error(f"Error downloading comic {feed_name}: {e}")
+                    ordered[index] = {
+                        'success': False,
+                        'feed_name': feed_name,
+                        'error': str(e)
+                    }
+
+        results = [ordered[index] for index in sorted(ordered)]
 
         # Summary
         successful = sum(1 for r in results if r['success'])
-        failed = len(results) - successful
+        skipped = sum(1 for r in results if r.get('skipped'))
+        failed = len(results) - successful - skipped
 
-        logger.info(f"Batch download complete: {successful} successful, {failed} failed")
+        logger.info(f"Batch download complete: {successful} successful, {skipped} skipped, {failed} failed")
 
         return results
@@ -2,7 +2,9 @@
 Comic-specific extractors for RSS Feed Processor
 """
 import re
-from bs4 import BeautifulSoup
+import threading
+import time
+from lxml import html as lxml_html
 from .base_extractor import ComicExtractor
 from ..utils.logging_config import get_logger
 from ..utils.http_client import fetch_url
@@ -11,6 +13,82 @@ from ..ollama_client.vision_processor import OllamaVisionClient
 logger = get_logger(__name__)
 
 
+# Per-site URL patterns, compiled once at import instead of per call
+_THUMBNAIL_SUFFIX_RE = re.compile(r'-\d+x\d+(\.(png|jpg|jpeg|gif))')
+_DIMENSION_SUFFIX_RE = re.compile(r'-\d+x\d+')
+_PENNY_ARCADE_COMIC_RE = re.compile(r'(https://assets\.penny-arcade\.com/comics/\d{8}-[a-zA-Z0-9]+\.jpg)')
+_PENNY_ARCADE_PANEL_RE = re.compile(r'src="(https://assets\.penny-arcade\.com/comics/.*?p1.*?)"')
+_OGLAF_COMIC_RE = re.compile(r'(https?://media\.oglaf\.com/comic/(?!tt)[^"]+\.jpg)')
+_WIDDERSHINS_COMIC_RE = re.compile(r'(https?://(?:www\.)?widdershinscomic\.com/comics/\d+-\d+\.png)')
+_WIDDERSHINS_FALLBACK_RE = re.compile(r'(?:src|href)="(https?://(?:www\.)?widdershinscomic\.com/comics/[^"]+\.png)"')
+_WONDERMARK_COMIC_RE = re.compile(r'(https?://wondermark\.com/wp-content/uploads/\d{4}/\d{2}/\d{4}-\d{2}-\d{2}-\d+[a-z]+\.png)')
+_WONDERMARK_FALLBACK_RE = re.compile(r'(https?://wondermark\.com/wp-content/uploads/[^"]+\.png)')
+_EVIL_INC_COMIC_RE = re.compile(r'(https?://[^"]*wp-content/uploads/\d{4}/\d{2}/\d{8}_evil\.jpg)')
+_EVIL_INC_FALLBACK_RE = re.compile(r'wp-content/uploads/(\d{4}/\d{2}/\d{8}_evil\.jpg)')
+_INCASE_COMIC_RE = re.compile(r'(https?://incase\.buttsmithy\.com/wp-content/uploads/\d{4}/\d{2}/[^"]+\.jpg)')
+_INCASE_FALLBACK_RE = re.compile(r'(https?://incase\.buttsmithy\.com/wp-content/uploads/[^"]+\.jpg)')
+
+
+def parse_html(html_content):
+    """
+    Parse an HTML fragment once for reuse across several XPath queries.
+
+    Args:
+        html_content: HTML string or fragment
+
+    Returns:
+        lxml element tree, or None on parse failure
+    """
+    try:
+        return lxml_html.fromstring(html_content)
+    except Exception as e:
+        logger.debug(f"Failed to parse HTML fragment: {e}")
+        return None
+
+
+def parse_image_srcs(html_content, xpath='//img/@src'):
+    """
+    Extract image src attributes from an HTML fragment using lxml.
+
+    lxml parses in C with compiled XPath - a single O(n) pass that is
+    robust to attribute reordering, unlike regexes over raw markup.
+
+    Args:
+        html_content: HTML string or fragment
+        xpath: XPath expression selecting the wanted attributes
+
+    Returns:
+        List of matched attribute values (empty on parse failure)
+    """
+    doc = parse_html(html_content)
+    return doc.xpath(xpath) if doc is not None else []
+
+
+def match_attr_urls(html_content, pattern, xpath='//img/@src'):
+    """
+    Run a URL pattern over attribute values from a single lxml parse.
+
+    One C-level parse plus short-string matches replaces regexing the
+    whole document, and anchoring on real attributes avoids false hits
+    in scripts or comments. Callers keep the full-document regex as a
+    fallback for URLs that sit outside the selected attributes.
+
+    Args:
+        html_content: Full HTML document
+        pattern: Compiled pattern with the URL in group 1
+        xpath: XPath selecting candidate attribute values
+
+    Returns:
+        List of matched URLs, in document order
+    """
+    matches = []
+    for value in parse_image_srcs(html_content, xpath):
+        match = pattern.search(value)
+        if match:
+            matches.append(match.group(1))
+    return matches
+
+
 class DefaultExtractor(ComicExtractor):
     """
     Default extractor for standard RSS feeds with <img src="..."> tags.
@@ -24,14 +102,14 @@ class DefaultExtractor(ComicExtractor):
             logger.warning(f"No content found for {self.feed_name}")
             return []
 
-        # Look for img tags
-        match = re.search(r'<img\s+[^>]*src="([^"]+)"', content)
+        # Look for img tags (lxml handles attribute order/quoting variations)
+        srcs = parse_image_srcs(content)
 
-        if match:
-            image_url = match.group(1)
+        if srcs:
+            image_url = srcs[0]
 
             # Remove WordPress thumbnail dimensions (e.g., -150x150, -300x200)
-            image_url = re.sub(r'-\d+x\d+(\.(png|jpg|jpeg|gif))', r'\1', image_url)
+            image_url = _THUMBNAIL_SUFFIX_RE.sub(r'\1', image_url)
 
             logger.debug(f"Found image URL in {self.feed_name}: {image_url}")
             return [image_url]
@@ -54,6 +132,7 @@ class PennyArcadeExtractor(ComicExtractor):
         if not comic_page_url or '/comic/' not in comic_page_url:
             logger.debug(f"Skipping non-comic Penny Arcade link: {comic_page_url}")
             # This isn't a comic, it's a news post - return empty to skip
+            self.skip_reason = 'non-comic link'
             return []
 
         try:
@@ -63,15 +142,21 @@ class PennyArcadeExtractor(ComicExtractor):
 
             # Penny Arcade format changed - now uses single image (no more p1/p2/p3)
             # Try new format first: assets.penny-arcade.com/comics/YYYYMMDD-XXXXXXXX.jpg
-            match = re.search(r'(https://assets\.penny-arcade\.com/comics/\d{8}-[a-zA-Z0-9]+\.jpg)', html_content)
+            comics = match_attr_urls(html_content, _PENNY_ARCADE_COMIC_RE)
+            if not comics:
+                # Fallback: full-document scan in case the URL sits
+                # outside an img src attribute
+                match = _PENNY_ARCADE_COMIC_RE.search(html_content)
+                if match:
+                    comics = [match.group(1)]
 
-            if match:
-                comic_url = match.group(1)
+            if comics:
+                comic_url = comics[0]
                 logger.debug(f"Found Penny Arcade comic: {comic_url}")
                 return [comic_url]
 
             # Fallback to old multi-panel format (p1, p2, p3)
-            match = re.search(r'src="(https://assets\.penny-arcade\.com/comics/.*?p1.*?)"', html_content)
+            match = _PENNY_ARCADE_PANEL_RE.search(html_content)
 
             if match:
                 panel1_url = match.group(1)
@@ -96,6 +181,13 @@ class OglafExtractor(ComicExtractor):
     Oglaf extractor - handles multi-page comics using vision model.
     """
 
+    # Main-page HTML shared across instances for a short window: retries
+    # and validation can re-run extraction within one batch, and the page
+    # is ~100 KB per fetch
+    _PAGE_CACHE_TTL = 60  # seconds
+    _page_cache = {}
+    _page_cache_lock = threading.Lock()
+
     def __init__(self, feed_data, session=None, use_vision=True):
         """
         Initialize Oglaf extractor.
@@ -109,18 +201,40 @@ class OglafExtractor(ComicExtractor):
         self.use_vision = use_vision
         self.vision_client = OllamaVisionClient() if use_vision else None
 
+    def _fetch_main_page(self, url):
+        """Fetch the main page, reusing a recent copy when available."""
+        now = time.time()
+
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+            if cached and now - cached[0] < self._PAGE_CACHE_TTL:
+                logger.debug(f"Using cached Oglaf page: {url}")
+                return cached[1]
+
+        response = fetch_url(url, session=self.session, allow_redirects=True)
+        html_content = response.text
+
+        if response.status_code == 200:
+            with self._page_cache_lock:
+                self._page_cache[url] = (now, html_content)
+
+        return html_content
+
     def extract_image_urls(self):
         """Extract Oglaf comic images. Pattern: media.oglaf.com/comic/NAME.jpg (tt prefix = title card)"""
         main_page_url = "https://www.oglaf.com/"
 
         try:
             # Fetch main page - may redirect to age-confirmation
-            response = fetch_url(main_page_url, session=self.session, allow_redirects=True)
-            html_content = response.text
+            html_content = self._fetch_main_page(main_page_url)
 
             # Look for comic pattern: media.oglaf.com/comic/XXXXX.jpg
             # Skip title cards (ttXXXXX.jpg)
-            comics = re.findall(r'(https?://media\.oglaf\.com/comic/(?!tt)[^"]+\.jpg)', html_content)
+            comics = match_attr_urls(html_content, _OGLAF_COMIC_RE)
+            if not comics:
+                # Fallback: full-document scan in case the URLs sit
+                # outside img src attributes
+                comics = _OGLAF_COMIC_RE.findall(html_content)
 
             if comics:
                 # Remove duplicates while preserving order
@@ -151,13 +265,13 @@ class WiddershinsExtractor(ComicExtractor):
         """Extract Widdershins comic image."""
         # Get comic page URL from RSS description
         description = self.entry.get('description', '')
-        match = re.search(r'<a\s+href="([^"]+)">', description)
+        hrefs = parse_image_srcs(description, '//a/@href') if description else []
 
-        if not match:
+        if hrefs:
+            comic_page_url = hrefs[0]
+        else:
             # Try direct link
             comic_page_url = self.entry.get('link')
-        else:
-            comic_page_url = match.group(1)
 
         if not comic_page_url:
             logger.warning("Could not find Widdershins comic page URL")
@@ -169,7 +283,7 @@ class WiddershinsExtractor(ComicExtractor):
             html_content = response.text
 
             # Look for pattern: widdershinscomic.com/comics/TIMESTAMP-NUMBER.png
-            match = re.search(r'(https?://(?:www\.)?widdershinscomic\.com/comics/\d+-\d+\.png)', html_content)
+            match = _WIDDERSHINS_COMIC_RE.search(html_content)
 
             if match:
                 image_url = match.group(1)
@@ -177,7 +291,7 @@ class WiddershinsExtractor(ComicExtractor):
                 return [image_url]
 
             # Fallback: look for any image in /comics/ directory
-            match = re.search(r'(?:src|href)="(https?://(?:www\.)?widdershinscomic\.com/comics/[^"]+\.png)"', html_content)
+            match = _WIDDERSHINS_FALLBACK_RE.search(html_content)
             if match:
                 image_url = match.group(1)
                 logger.debug(f"Found Widdershins image (fallback): {image_url}")
@@ -210,13 +324,13 @@ class GunnerkriggExtractor(ComicExtractor):
             html_content = response.text
 
             # Find comic image
-            img_match = re.search(r'<img\s+class="comic_image"[^>]*src="([^"]+)"', html_content)
+            srcs = parse_image_srcs(html_content, '//img[@class="comic_image"]/@src')
 
-            if not img_match:
+            if not srcs:
                 logger.warning("Could not find Gunnerkrigg Court comic image")
                 return []
 
-            image_url = img_match.group(1)
+            image_url = srcs[0]
 
             # Handle relative URLs
             if not image_url.startswith('http'):
@@ -243,18 +357,20 @@ class SavestateExtractor(ComicExtractor):
             logger.warning(f"No content found for {self.feed_name}")
             return []
 
-        # Look for img tag (specific pattern from reference)
-        match = re.search(r'<p><a\s+href[^>]*<img[^>]*src="([^"]+)"', content)
+        # Parse once, query twice: linked img first (specific pattern from
+        # reference), then any img as fallback
+        doc = parse_html(content)
+        srcs = doc.xpath('//p/a//img/@src') if doc is not None else []
 
-        if not match:
-            # Fallback to standard img pattern
-            match = re.search(r'<img\s+[^>]*src="([^"]+)"', content)
+        if not srcs and doc is not None:
+            # Fallback to any img
+            srcs = doc.xpath('//img/@src')
 
-        if match:
-            image_url = match.group(1)
+        if srcs:
+            image_url = srcs[0]
 
             # Remove dimension suffix (e.g., -300x200)
-            image_url = re.sub(r'-\d+x\d+', '', image_url)
+            image_url = _DIMENSION_SUFFIX_RE.sub('', image_url)
 
             logger.debug(f"Found Savestate image: {image_url}")
             return [image_url]
@@ -282,7 +398,7 @@ class WondermarkExtractor(ComicExtractor):
             html_content = response.text
 
             # Look for pattern: wp-content/uploads/YYYY/MM/YYYY-MM-DD-####xxxx.png
-            match = re.search(r'(https?://wondermark\.com/wp-content/uploads/\d{4}/\d{2}/\d{4}-\d{2}-\d{2}-\d+[a-z]+\.png)', html_content)
+            match = _WONDERMARK_COMIC_RE.search(html_content)
 
             if match:
                 image_url = match.group(1)
@@ -290,7 +406,7 @@ class WondermarkExtractor(ComicExtractor):
                 return [image_url]
 
             # Fallback: any image in wp-content/uploads
-            match = re.search(r'(https?://wondermark\.com/wp-content/uploads/[^"]+\.png)', html_content)
+            match = _WONDERMARK_FALLBACK_RE.search(html_content)
             if match:
                 image_url = match.group(1)
                 logger.debug(f"Found Wondermark image (fallback): {image_url}")
@@ -326,7 +442,7 @@ class EvilIncExtractor(ComicExtractor):
 
             # Look for the composite image: YYYYMMDD_evil.jpg (NOT evil01-06.png)
             # This is a full composite of all panels
-            match = re.search(r'(https?://[^"]*wp-content/uploads/\d{4}/\d{2}/\d{8}_evil\.jpg)', html_content)
+            match = _EVIL_INC_COMIC_RE.search(html_content)
 
             if match:
                 image_url = match.group(1)
@@ -334,7 +450,7 @@ class EvilIncExtractor(ComicExtractor):
                 return [image_url]
 
             # Fallback: try without full URL
-            match = re.search(r'wp-content/uploads/(\d{4}/\d{2}/\d{8}_evil\.jpg)', html_content)
+            match = _EVIL_INC_FALLBACK_RE.search(html_content)
             if match:
                 image_url = f"https://www.evil-inc.com/wp-content/uploads/{match.group(1)}"
                 logger.debug(f"Found Evil Inc composite image (relative): {image_url}")
@@ -368,7 +484,7 @@ class IncaseExtractor(ComicExtractor):
             html_content = response.text
 
             # Look for pattern: buttsmithy.com/wp-content/uploads/YYYY/MM/*.jpg
-            match = re.search(r'(https?://incase\.buttsmithy\.com/wp-content/uploads/\d{4}/\d{2}/[^"]+\.jpg)', html_content)
+            match = _INCASE_COMIC_RE.search(html_content)
 
             if match:
                 image_url = match.group(1)
@@ -376,7 +492,7 @@ class IncaseExtractor(ComicExtractor):
                 return [image_url]
 
             # Fallback: any jpg in wp-content/uploads
-            match = re.search(r'(https?://incase\.buttsmithy\.com/wp-content/uploads/[^"]+\.jpg)', html_content)
+            match = _INCASE_FALLBACK_RE.search(html_content)
             if match:
                 image_url = match.group(1)
                 logger.debug(f"Found Incase image (fallback): {image_url}")
@@ -390,6 +506,20 @@ class IncaseExtractor(ComicExtractor):
             return []
 
 
+# Special-handler name -> extractor class, built once at import instead
+# of per get_extractor call
+_EXTRACTOR_REGISTRY = {
+    'penny_arcade': PennyArcadeExtractor,
+    'oglaf': OglafExtractor,
+    'widdershins': WiddershinsExtractor,
+    'gunnerkrigg': GunnerkriggExtractor,
+    'savestate': SavestateExtractor,
+    'wondermark': WondermarkExtractor,
+    'evil_inc': EvilIncExtractor,
+    'incase': IncaseExtractor,
+}
+
+
 def get_extractor(feed_data, session=None, use_vision=True):
     """
     Factory function to get appropriate extractor for a feed.
@@ -402,25 +532,10 @@ def get_extractor(feed_data, session=None, use_vision=True):
     Returns:
         ComicExtractor instance
     """
-    special_handler = feed_data.get('special_handler')
-
-    extractors = {
-        'penny_arcade': PennyArcadeExtractor,
-        'oglaf': lambda fd, s: OglafExtractor(fd, s, use_vision=use_vision),
-        'widdershins': WiddershinsExtractor,
-        'gunnerkrigg': GunnerkriggExtractor,
-        'savestate': SavestateExtractor,
-        'wondermark': WondermarkExtractor,
-        'evil_inc': EvilIncExtractor,
-        'incase': IncaseExtractor,
-    }
-
-    if special_handler in extractors:
-        extractor_class = extractors[special_handler]
-        if callable(extractor_class) and special_handler == 'oglaf':
-            return extractor_class(feed_data, session)
-        else:
-            return extractor_class(feed_data, session)
+    extractor_class = _EXTRACTOR_REGISTRY.get(feed_data.get('special_handler'), DefaultExtractor)
+
+    if extractor_class is OglafExtractor:
+        # Oglaf is the only extractor with a vision toggle
+        return extractor_class(feed_data, session, use_vision=use_vision)
 
-    # Default extractor
-    return DefaultExtractor(feed_data, session)
+    return extractor_class(feed_data, session)
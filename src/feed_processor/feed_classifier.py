@@ -2,6 +2,9 @@
 Feed classification utilities for RSS Feed Processor
 """
 import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urlparse
 from ..utils.logging_config import get_logger
 from ..config import FEED_TYPES, SPECIAL_HANDLERS, FEED_TYPE_OVERRIDES_FILE
@@ -9,6 +12,135 @@ from .feed_type_detector import FeedTypeDetector
 
 logger = get_logger(__name__)
 
+# Compiled once for get_feed_name: trailing TLD to drop, separators to
+# space out - one re.sub each instead of six chained str.replace passes
+_TLD_RE = re.compile(r'\.(com|net|it|org)$')
+_SEP_RE = re.compile(r'[-_]')
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url):
+    """
+    Extract the lowercased domain (minus www.) from a URL.
+
+    Memoized: classify_feed, get_special_handler and get_feed_name all
+    parse the same handful of feed URLs repeatedly within one run, and
+    urlparse plus the string ops is pure-Python work a dict hit replaces.
+
+    Args:
+        url: URL string
+
+    Returns:
+        Domain string ('' on parse failure)
+    """
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+
+        # Remove www. prefix
+        if domain.startswith('www.'):
+            domain = domain[4:]
+
+        return domain
+
+    except Exception as e:
+        logger.error(f"Error extracting domain from {url}: {e}")
+        return ""
+
+
+def _lookup_by_suffix(domain, mapping):
+    """
+    Look up a domain in a {domain: value} mapping by walking its suffixes.
+
+    'feeds.penny-arcade.com' probes 'feeds.penny-arcade.com', then
+    'penny-arcade.com', then 'com' - a handful of dict hits instead of a
+    substring scan over every known domain. Exact suffix matching also
+    can't false-positive the way 'xkcd.com' in 'notxkcd.com' did.
+
+    Args:
+        domain: Lowercased domain (no scheme, no www.)
+        mapping: Dict keyed by registrable domains
+
+    Returns:
+        Tuple of (matched suffix, value), or (None, None) if no match
+    """
+    labels = domain.split('.')
+    for start in range(len(labels) - 1):
+        suffix = '.'.join(labels[start:])
+        value = mapping.get(suffix)
+        if value is not None:
+            return suffix, value
+    return None, None
+
+
+@lru_cache(maxsize=1)
+def _load_overrides_file(path, mtime):
+    """
+    Parse the manual overrides file, cached on (path, mtime).
+
+    Every FeedClassifier() used to re-open and re-parse the file; keying
+    the cache on the mtime means repeat constructors get the pre-parsed
+    mapping for free while an edited file is still picked up.
+
+    Args:
+        path: Overrides file path
+        mtime: File modification time (cache key; None if file absent)
+
+    Returns:
+        Read-only mapping of feed_url -> feed_type
+    """
+    overrides = {}
+
+    if mtime is None:
+        logger.debug(f"No manual overrides file found at {path}")
+        return MappingProxyType(overrides)
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                # Strip whitespace
+                line = line.strip()
+
+                # Skip empty lines and comments
+                if not line or line.startswith('#'):
+                    continue
+
+                # Parse line: feed_url = type
+                if '=' not in line:
+                    logger.warning(f"Invalid override at line {line_num}: missing '=' separator: {line}")
+                    continue
+
+                parts = line.split('=', 1)
+                if len(parts) != 2:
+                    logger.warning(f"Invalid override at line {line_num}: {line}")
+                    continue
+
+                feed_url = parts[0].strip()
+                feed_type = parts[1].strip().lower()
+
+                # Validate feed type
+                if feed_type not in ['comic', 'news']:
+                    logger.warning(f"Invalid feed type at line {line_num}: '{feed_type}' (must be 'comic' or 'news')")
+                    continue
+
+                # Validate URL (basic check)
+                if not feed_url.startswith('http'):
+                    logger.warning(f"Invalid URL at line {line_num}: {feed_url} (must start with http/https)")
+                    continue
+
+                overrides[feed_url] = feed_type
+                logger.debug(f"Loaded manual override: {feed_url} = {feed_type}")
+
+        if overrides:
+            logger.info(f"Loaded {len(overrides)} manual feed type override(s) from {path}")
+        else:
+            logger.debug(f"No valid overrides found in {path}")
+
+    except Exception as e:
+        logger.error(f"Error loading manual overrides from {path}: {e}")
+
+    return MappingProxyType(overrides)
+
 
 class FeedClassifier:
     """
@@ -16,6 +148,11 @@ class FeedClassifier:
     Uses AI (Ollama, LM Studio, etc.) for automatic detection of unknown feeds.
     """
 
+    # One classifier can exist per worker; slots skip the per-instance
+    # __dict__ and make attribute access a fixed-offset load
+    __slots__ = ('use_ai_detection', 'feed_detector', 'manual_overrides',
+                 '_result_cache')
+
     def __init__(self, use_ai_detection=True, ai_client=None):
         """
         Initialize feed classifier.
@@ -33,6 +170,11 @@ class FeedClassifier:
 
         self.manual_overrides = self._load_manual_overrides()
 
+        # Settled classifications per URL - the same feed can be
+        # classified again per entry, and the 5-priority chain (with its
+        # logging) only needs to run once per URL per run
+        self._result_cache = {}
+
     def classify_feed(self, feed_url, feed_data=None):
         """
         Classify a feed URL as 'comic' or 'news'.
@@ -51,25 +193,33 @@ class FeedClassifier:
         Returns:
             'comic' or 'news'
         """
+        # Settled once already this run - skip the whole chain
+        memoized = self._result_cache.get(feed_url)
+        if memoized:
+            return memoized
+
         domain = self._extract_domain(feed_url)
 
         # Priority 1: Check manual overrides first (user always right!)
         if feed_url in self.manual_overrides:
             feed_type = self.manual_overrides[feed_url]
             logger.info(f"Classified {feed_url} as {feed_type} (manual override)")
+            self._result_cache[feed_url] = feed_type
             return feed_type
 
         # Priority 2: Check against explicit configuration in FEED_TYPES
-        for known_domain, feed_type in FEED_TYPES.items():
-            if known_domain in domain:
-                logger.debug(f"Classified {feed_url} as {feed_type} (matched {known_domain})")
-                return feed_type
+        known_domain, feed_type = _lookup_by_suffix(domain, FEED_TYPES)
+        if feed_type:
+            logger.debug(f"Classified {feed_url} as {feed_type} (matched {known_domain})")
+            self._result_cache[feed_url] = feed_type
+            return feed_type
 
         # Priority 3: Check cache
         if self.feed_detector:
             cached_type = self.feed_detector.get_cached_type(feed_url)
             if cached_type:
                 logger.info(f"Classified {feed_url} as {cached_type} (from cache)")
+                self._result_cache[feed_url] = cached_type
                 return cached_type
 
         # Priority 4: Use AI detection if feed_data is available
@@ -79,14 +229,26 @@ class FeedClassifier:
             if detected_type:
                 logger.info(f"Classified {feed_url} as '{detected_type}' (AI detection). "
                            f"To override, add to feed_type_overrides.txt: {feed_url} = comic|news")
+                self._result_cache[feed_url] = detected_type
                 return detected_type
             else:
                 logger.warning(f"AI detection failed for {feed_url}, using default")
 
-        # Priority 5: Default to comic (safer assumption for this use case)
+        # Priority 5: Default to comic (safer assumption for this use
+        # case). Deliberately not memoized: a later call that brings
+        # feed_data should still get its shot at AI detection.
         logger.debug(f"Classified {feed_url} as comic (default)")
         return 'comic'
 
+    def invalidate(self, feed_url):
+        """
+        Drop the memoized classification for a feed URL.
+
+        Args:
+            feed_url: URL of the feed to re-classify on next call
+        """
+        self._result_cache.pop(feed_url, None)
+
     def get_special_handler(self, feed_url):
         """
         Get special handler name for a feed if it requires one.
@@ -99,16 +261,16 @@ class FeedClassifier:
         """
         domain = self._extract_domain(feed_url)
 
-        for special_domain, handler_name in SPECIAL_HANDLERS.items():
-            if special_domain in domain:
-                logger.debug(f"Found special handler for {feed_url}: {handler_name}")
-                return handler_name
+        _, handler_name = _lookup_by_suffix(domain, SPECIAL_HANDLERS)
+        if handler_name:
+            logger.debug(f"Found special handler for {feed_url}: {handler_name}")
+            return handler_name
 
         return None
 
     def _extract_domain(self, url):
         """
-        Extract domain from URL.
+        Extract domain from URL (memoized at module level).
 
         Args:
             url: URL string
@@ -116,19 +278,7 @@ class FeedClassifier:
         Returns:
             Domain string
         """
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove www. prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-
-            return domain
-
-        except Exception as e:
-            logger.error(f"Error extracting domain from {url}: {e}")
-            return ""
+        return _extract_domain(url)
 
     def get_feed_name(self, feed_url):
         """
@@ -142,69 +292,24 @@ class FeedClassifier:
         """
         domain = self._extract_domain(feed_url)
 
-        # Remove common suffixes
-        name = domain.replace('.com', '').replace('.net', '').replace('.it', '').replace('.org', '')
-
-        # Capitalize first letter of each word
-        name = ' '.join(word.capitalize() for word in name.replace('-', ' ').replace('_', ' ').split())
+        # Drop the trailing TLD, space out separators, then title-case
+        name = _SEP_RE.sub(' ', _TLD_RE.sub('', domain))
 
-        return name
+        return name.title()
 
     def _load_manual_overrides(self):
         """
         Load manual feed type overrides from feed_type_overrides.txt.
 
+        Parsing is cached at module scope keyed on the file's mtime, so
+        constructing several classifiers does not re-read the file.
+
         Returns:
-            dict mapping feed_url -> feed_type
+            Read-only mapping of feed_url -> feed_type
         """
-        overrides = {}
-
-        if not os.path.exists(FEED_TYPE_OVERRIDES_FILE):
-            logger.debug(f"No manual overrides file found at {FEED_TYPE_OVERRIDES_FILE}")
-            return overrides
-
         try:
-            with open(FEED_TYPE_OVERRIDES_FILE, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    # Strip whitespace
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # Parse line: feed_url = type
-                    if '=' not in line:
-                        logger.warning(f"Invalid override at line {line_num}: missing '=' separator: {line}")
-                        continue
-
-                    parts = line.split('=', 1)
-                    if len(parts) != 2:
-                        logger.warning(f"Invalid override at line {line_num}: {line}")
-                        continue
-
-                    feed_url = parts[0].strip()
-                    feed_type = parts[1].strip().lower()
-
-                    # Validate feed type
-                    if feed_type not in ['comic', 'news']:
-                        logger.warning(f"Invalid feed type at line {line_num}: '{feed_type}' (must be 'comic' or 'news')")
-                        continue
-
-                    # Validate URL (basic check)
-                    if not feed_url.startswith('http'):
-                        logger.warning(f"Invalid URL at line {line_num}: {feed_url} (must start with http/https)")
-                        continue
-
-                    overrides[feed_url] = feed_type
-                    logger.debug(f"Loaded manual override: {feed_url} = {feed_type}")
-
-            if overrides:
-                logger.info(f"Loaded {len(overrides)} manual feed type override(s) from {FEED_TYPE_OVERRIDES_FILE}")
-            else:
-                logger.debug(f"No valid overrides found in {FEED_TYPE_OVERRIDES_FILE}")
-
-        except Exception as e:
-            logger.error(f"Error loading manual overrides from {FEED_TYPE_OVERRIDES_FILE}: {e}")
+            mtime = os.path.getmtime(FEED_TYPE_OVERRIDES_FILE)
+        except OSError:
+            mtime = None
 
-        return overrides
+        return _load_overrides_file(FEED_TYPE_OVERRIDES_FILE, mtime)
@@ -1,8 +1,27 @@
 """
 Feed language detection using AI for RSS Feed Processor
 """
+import atexit
+import html
 import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from langdetect import DetectorFactory, detect_langs
+    DetectorFactory.seed = 0  # deterministic results across runs
+except ImportError:
+    detect_langs = None
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urlparse
 from ..ai_client.base import BaseAIClient
 from ..utils.logging_config import get_logger
@@ -11,6 +30,193 @@ from ..config import TEXT_MODEL, FEED_LANGUAGE_CACHE_FILE, FEED_LANGUAGE_OVERRID
 logger = get_logger(__name__)
 
 
+def _cache_dumps(obj):
+    """Serialize the language cache, preferring orjson's C encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _cache_loads(data):
+    """Deserialize the language cache, preferring orjson's C decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ISO 639-1 codes from langdetect mapped to the English names the rest
+# of the pipeline (prompts, overrides, cache) already uses
+_ISO_LANGUAGE_NAMES = {
+    'en': 'English',
+    'it': 'Italian',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'pt': 'Portuguese',
+    'nl': 'Dutch',
+    'ru': 'Russian',
+    'pl': 'Polish',
+    'sv': 'Swedish',
+    'da': 'Danish',
+    'no': 'Norwegian',
+    'fi': 'Finnish',
+    'tr': 'Turkish',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'zh-cn': 'Chinese',
+    'zh-tw': 'Chinese',
+    'ar': 'Arabic',
+}
+
+# Punctuation scrubbed from AI language answers; a precomputed
+# translation table beats rebuilding str.strip's char set per call
+_STRIP_TRANS = str.maketrans('', '', '"\'.,')
+
+_WS_RE = re.compile(r'\s+')
+
+
+def _clean_sample(text, limit=80):
+    """Unescape HTML entities, collapse whitespace, cap length - prompt
+    tokens are pure prefill latency on local models."""
+    return _WS_RE.sub(' ', html.unescape(text)).strip()[:limit]
+
+# Below this the local guess is not trustworthy enough to skip the AI
+_LOCAL_DETECTION_MIN_PROBABILITY = 0.9
+# Very short samples make n-gram classifiers guess wildly
+_LOCAL_DETECTION_MIN_CHARS = 40
+
+
+def _sample_text(entries):
+    """Concatenate entry titles/descriptions into one detection sample."""
+    parts = []
+    for entry in entries:
+        parts.append(entry.get('title', ''))
+        parts.append(entry.get('description', '')[:200])
+    return ' '.join(part for part in parts if part)
+
+
+def _local_language_verdict(text):
+    """
+    Try to settle the feed language locally, without an AI round-trip.
+
+    Uses langdetect's n-gram classifier when installed: a millisecond of
+    local work against a 100-1000 ms LLM call for a task that is usually
+    obvious. Returns None whenever unsure so the AI path still decides.
+
+    Args:
+        text: Concatenated sample titles/descriptions from the feed
+
+    Returns:
+        Language name (e.g., "Italian"), or None if unavailable/unsure
+    """
+    if detect_langs is None or len(text) < _LOCAL_DETECTION_MIN_CHARS:
+        return None
+
+    try:
+        candidates = detect_langs(text)
+    except Exception:
+        # langdetect raises on texts with no usable features
+        return None
+
+    if not candidates:
+        return None
+
+    best = candidates[0]
+    if best.prob < _LOCAL_DETECTION_MIN_PROBABILITY:
+        return None
+
+    return _ISO_LANGUAGE_NAMES.get(best.lang)
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(feed_url):
+    """
+    Extract domain from feed URL for caching.
+
+    Memoized: language lookup, caching and override checks all re-parse
+    the same feed URLs several times per run.
+
+    Args:
+        feed_url: Feed URL
+
+    Returns:
+        Domain string (e.g., "macitynet.it")
+    """
+    try:
+        parsed = urlparse(feed_url)
+        domain = parsed.netloc
+
+        # Remove www. prefix if present
+        if domain.startswith('www.'):
+            domain = domain[4:]
+
+        return domain
+    except Exception as e:
+        logger.error(f"Failed to extract domain from {feed_url}: {e}")
+        return feed_url  # Fallback to full URL
+
+
+@lru_cache(maxsize=1)
+def _load_overrides_file(path, mtime):
+    """
+    Parse the language overrides file, cached on (path, mtime).
+
+    Every FeedLanguageDetector() used to re-open and re-parse the file;
+    keying the cache on the mtime means repeat constructors get the
+    pre-parsed mapping for free while an edited file is still picked up.
+
+    Args:
+        path: Overrides file path
+        mtime: File modification time (cache key; None if file absent)
+
+    Returns:
+        Read-only mapping of domain -> language
+    """
+    overrides = {}
+
+    if mtime is None:
+        logger.debug(f"Language override file not found: {path}")
+        return MappingProxyType(overrides)
+
+    try:
+        with open(path, 'r') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+
+                # Skip comments and empty lines
+                if not line or line.startswith('#'):
+                    continue
+
+                # Parse: domain_or_url = language
+                if '=' not in line:
+                    logger.warning(f"Invalid override format at line {line_num}: {line}")
+                    continue
+
+                parts = line.split('=', 1)
+                if len(parts) != 2:
+                    logger.warning(f"Invalid override format at line {line_num}: {line}")
+                    continue
+
+                domain_or_url = parts[0].strip()
+                language = parts[1].strip()
+
+                # Extract domain if full URL provided
+                if domain_or_url.startswith('http'):
+                    domain = _extract_domain(domain_or_url)
+                else:
+                    domain = domain_or_url
+
+                overrides[domain] = language
+                logger.debug(f"Loaded language override: {domain} = {language}")
+
+        logger.info(f"Loaded {len(overrides)} language overrides from {path}")
+
+    except Exception as e:
+        logger.error(f"Failed to load language overrides from {path}: {e}")
+
+    return MappingProxyType(overrides)
+
+
 class FeedLanguageDetector:
     """
     Detect the language of a feed using AI.
@@ -18,6 +224,14 @@ class FeedLanguageDetector:
     Manual overrides take highest priority.
     """
 
+    # One detector can exist per worker; slots skip the per-instance
+    # __dict__ and make attribute access a fixed-offset load
+    __slots__ = (
+        'cache_file', 'override_file', 'cache', 'overrides',
+        '_dirty_keys', '_cache_lock', '_health_result',
+        '_health_checked_at', 'client', 'model',
+    )
+
     def __init__(self, ai_client=None, cache_file=None, override_file=None, model=None):
         """
         Initialize feed language detector.
@@ -33,6 +247,21 @@ class FeedLanguageDetector:
         self.cache = self._load_cache()
         self.overrides = self._load_overrides()
 
+        # Write-behind cache: reads are pure dict hits, detections
+        # accumulate as dirty keys and hit disk once per batch (or at
+        # the auto-flush threshold); atexit covers callers that never
+        # reach an explicit flush()
+        self._dirty_keys = set()
+        # Reentrant: _cache_insert may auto-flush (and thus save) while
+        # holding the lock; detections can arrive from worker threads
+        self._cache_lock = threading.RLock()
+        atexit.register(self.flush)
+
+        # health_check() is an HTTP round-trip to the AI server; its
+        # answer is reused for a short window instead of re-asked per feed
+        self._health_result = None
+        self._health_checked_at = 0.0
+
         # Use provided client or create default one
         if ai_client is None:
             from ..ai_client import create_ai_client_with_fallback
@@ -60,8 +289,8 @@ class FeedLanguageDetector:
             return {}
 
         try:
-            with open(self.cache_file, 'r') as f:
-                cache = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                cache = _cache_loads(f.read())
             logger.info(f"Loaded {len(cache)} feed languages from cache")
             return cache
         except Exception as e:
@@ -70,64 +299,81 @@ class FeedLanguageDetector:
 
     def _save_cache(self):
         """
-        Save feed language cache to disk.
+        Save feed language cache to disk atomically (write + rename).
         """
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            temp_path = self.cache_file + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(_cache_dumps(self.cache))
+            os.replace(temp_path, self.cache_file)
+            self._dirty_keys.clear()
             logger.debug(f"Saved {len(self.cache)} feed languages to cache")
         except Exception as e:
             logger.error(f"Failed to save language cache to {self.cache_file}: {e}")
 
-    def _load_overrides(self):
+    def flush(self):
         """
-        Load manual language overrides from file.
-
-        Returns:
-            dict with domain -> language mappings
+        Write the cache to disk if any detections were added since the
+        last save. Called once at process exit (and safe to call earlier).
         """
-        if not os.path.exists(self.override_file):
-            logger.debug(f"Language override file not found: {self.override_file}")
-            return {}
+        with self._cache_lock:
+            if self._dirty_keys:
+                self._save_cache()
 
-        overrides = {}
-        try:
-            with open(self.override_file, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
+    # Bound how much unsaved work a crash can lose during long runs
+    _AUTO_FLUSH_THRESHOLD = 10
 
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
+    # Server availability rarely changes mid-run; 30 s keeps N unknown
+    # feeds from paying N health-check round-trips
+    _HEALTH_CHECK_TTL = 30
 
-                    # Parse: domain_or_url = language
-                    if '=' not in line:
-                        logger.warning(f"Invalid override format at line {line_num}: {line}")
-                        continue
+    def _server_available(self):
+        """
+        Check AI server availability, caching the answer briefly.
 
-                    parts = line.split('=', 1)
-                    if len(parts) != 2:
-                        logger.warning(f"Invalid override format at line {line_num}: {line}")
-                        continue
+        Returns:
+            True if the server answered a health check within the TTL
+        """
+        now = time.monotonic()
+        if (self._health_result is None
+                or now - self._health_checked_at >= self._HEALTH_CHECK_TTL):
+            self._health_result = self.client.health_check()
+            self._health_checked_at = now
+        return self._health_result
+
+    def _cache_insert(self, domain, language):
+        """
+        Record a detection in the RAM cache with write-behind persistence.
 
-                    domain_or_url = parts[0].strip()
-                    language = parts[1].strip()
+        The disk write is deferred to flush(), except that every
+        _AUTO_FLUSH_THRESHOLD unsaved entries trigger an early save.
 
-                    # Extract domain if full URL provided
-                    if domain_or_url.startswith('http'):
-                        domain = self._extract_domain(domain_or_url)
-                    else:
-                        domain = domain_or_url
+        Args:
+            domain: Feed domain
+            language: Detected language name
+        """
+        with self._cache_lock:
+            self.cache[domain] = language
+            self._dirty_keys.add(domain)
+            if len(self._dirty_keys) >= self._AUTO_FLUSH_THRESHOLD:
+                self._save_cache()
 
-                    overrides[domain] = language
-                    logger.debug(f"Loaded language override: {domain} = {language}")
+    def _load_overrides(self):
+        """
+        Load manual language overrides from file.
 
-            logger.info(f"Loaded {len(overrides)} language overrides from {self.override_file}")
-            return overrides
+        Parsing is cached at module scope keyed on the file's mtime, so
+        constructing several detectors does not re-read the file.
 
-        except Exception as e:
-            logger.error(f"Failed to load language overrides from {self.override_file}: {e}")
-            return {}
+        Returns:
+            Read-only mapping of domain -> language
+        """
+        try:
+            mtime = os.path.getmtime(self.override_file)
+        except OSError:
+            mtime = None
+
+        return _load_overrides_file(self.override_file, mtime)
 
     def _get_model_from_config(self):
         """
@@ -152,7 +398,7 @@ class FeedLanguageDetector:
 
     def _extract_domain(self, feed_url):
         """
-        Extract domain from feed URL for caching.
+        Extract domain from feed URL (memoized at module level).
 
         Args:
             feed_url: Feed URL
@@ -160,18 +406,7 @@ class FeedLanguageDetector:
         Returns:
             Domain string (e.g., "macitynet.it")
         """
-        try:
-            parsed = urlparse(feed_url)
-            domain = parsed.netloc
-
-            # Remove www. prefix if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-
-            return domain
-        except Exception as e:
-            logger.error(f"Failed to extract domain from {feed_url}: {e}")
-            return feed_url  # Fallback to full URL
+        return _extract_domain(feed_url)
 
     def get_feed_language(self, feed_url, feed_data=None):
         """
@@ -188,8 +423,24 @@ class FeedLanguageDetector:
         Returns:
             Language name (e.g., "English", "Italian", "Spanish")
         """
-        domain = self._extract_domain(feed_url)
+        return self.get_feed_language_by_domain(
+            self._extract_domain(feed_url), feed_url, feed_data)
+
+    def get_feed_language_by_domain(self, domain, feed_url=None, feed_data=None):
+        """
+        Same as get_feed_language for callers that already hold the
+        domain - the pipeline extracts it once per feed and can pass it
+        here, to classify_feed, and to get_special_handler without
+        re-parsing the URL three times.
 
+        Args:
+            domain: Pre-extracted feed domain (e.g., "macitynet.it")
+            feed_url: Original feed URL (needed only for AI detection)
+            feed_data: Optional parsed feed data for AI detection
+
+        Returns:
+            Language name (e.g., "English", "Italian", "Spanish")
+        """
         # Priority 1: Check manual overrides
         if domain in self.overrides:
             language = self.overrides[domain]
@@ -203,12 +454,11 @@ class FeedLanguageDetector:
             return language
 
         # Priority 3: AI detection
-        if feed_data:
+        if feed_data and feed_url:
             language = self.detect_feed_language(feed_url, feed_data)
             if language:
-                # Cache the result
-                self.cache[domain] = language
-                self._save_cache()
+                # Cache the result; persistence is write-behind
+                self._cache_insert(domain, language)
                 logger.info(f"Feed {domain} language detected via AI: {language}")
                 return language
 
@@ -216,6 +466,210 @@ class FeedLanguageDetector:
         logger.info(f"Feed {domain} language defaulting to English")
         return "English"
 
+    def get_feed_languages(self, feeds):
+        """
+        Resolve languages for several feeds, batching unknown ones into a
+        single AI call.
+
+        Overrides and the cache are consulted per feed exactly like
+        get_feed_language; only the leftovers pay for detection, and they
+        share one generate() round-trip instead of one each.
+
+        Args:
+            feeds: List of (feed_url, feed_data) tuples
+
+        Returns:
+            dict mapping feed_url -> language name
+        """
+        results = {}
+        unknown = []
+
+        for feed_url, feed_data in feeds:
+            domain = self._extract_domain(feed_url)
+
+            if domain in self.overrides:
+                results[feed_url] = self.overrides[domain]
+            elif domain in self.cache:
+                results[feed_url] = self.cache[domain]
+            elif feed_data:
+                unknown.append((feed_url, feed_data))
+            else:
+                results[feed_url] = "English"
+
+        if unknown:
+            detected = self.detect_feed_languages_batch(unknown)
+            for feed_url, _ in unknown:
+                results[feed_url] = detected.get(feed_url) or "English"
+
+        return results
+
+    def detect_feed_languages_batch(self, feeds):
+        """
+        Detect languages for several feeds with a single AI call.
+
+        One prompt carries numbered samples from every feed and asks for
+        a JSON object of number -> language, amortizing model prefill and
+        HTTP overhead across feeds instead of paying a round-trip each.
+
+        Args:
+            feeds: List of (feed_url, feed_data) tuples to detect
+
+        Returns:
+            dict mapping feed_url -> language name (feeds whose answer
+            could not be parsed are omitted)
+        """
+        if not feeds:
+            return {}
+
+        # Settle what we can locally; only the unsure feeds go to the AI
+        results = {}
+        remaining = []
+        for feed_url, feed_data in feeds:
+            language = _local_language_verdict(
+                _sample_text(feed_data.get('entries', [])[:3]))
+            if language:
+                domain = self._extract_domain(feed_url)
+                self._cache_insert(domain, language)
+                results[feed_url] = language
+                logger.info(f"Feed {domain} language detected locally: {language}")
+            else:
+                remaining.append((feed_url, feed_data))
+
+        if results:
+            if remaining:
+                results.update(self._detect_batch_via_ai(remaining))
+            return results
+
+        return self._detect_batch_via_ai(feeds)
+
+    def _detect_batch_via_ai(self, feeds):
+        """
+        AI leg of detect_feed_languages_batch: one generate() call for
+        every feed the local classifier could not settle.
+
+        Args:
+            feeds: List of (feed_url, feed_data) tuples to detect
+
+        Returns:
+            dict mapping feed_url -> language name
+        """
+        if not feeds:
+            return {}
+
+        if len(feeds) == 1:
+            # No batching to amortize - reuse the single-feed prompt
+            feed_url, feed_data = feeds[0]
+            language = self.detect_feed_language(feed_url, feed_data)
+            if not language:
+                return {}
+            self._cache_insert(self._extract_domain(feed_url), language)
+            return {feed_url: language}
+
+        if not self._server_available():
+            logger.warning("AI server not available, cannot detect feed languages")
+            return {}
+
+        prompt_parts = []
+        for number, (feed_url, feed_data) in enumerate(feeds, 1):
+            entries = feed_data.get('entries', [])[:2]
+            prompt_parts.append(f"Feed {number} (title: {_clean_sample(feed_data.get('title', 'Unknown'))}):")
+            for entry in entries:
+                title = _clean_sample(entry.get('title', 'Untitled'))
+                description = _clean_sample(entry.get('description', ''))
+                prompt_parts.append(f"  - {title}")
+                if description:
+                    prompt_parts.append(f"    {description}")
+            prompt_parts.append("")
+
+        prompt_parts.append(
+            "For each numbered feed above, determine the language its entries are "
+            "written in. Respond with ONLY a JSON object mapping the feed number to "
+            'the language name in English, e.g. {"1": "Italian", "2": "English"}.'
+        )
+
+        try:
+            response = self.client.generate(
+                model=self.model,
+                prompt="\n".join(prompt_parts),
+                system=(
+                    "You are a language detection expert. "
+                    "Respond with only the requested JSON object, no explanations."
+                ),
+                temperature=FEED_LANGUAGE_DETECTION_TEMPERATURE
+            )
+
+            if not response:
+                logger.error("AI returned no response for batch language detection")
+                return self._detect_concurrently(feeds)
+
+            # Strip optional markdown fences before parsing
+            text = response.strip()
+            if text.startswith('```'):
+                text = text.strip('`')
+                if text.startswith('json'):
+                    text = text[4:]
+            answers = json.loads(text)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Could not parse batch language detection response: {e}")
+            return self._detect_concurrently(feeds)
+        except Exception as e:
+            logger.error(f"Error in batch language detection: {e}")
+            return {}
+
+        results = {}
+        for number, (feed_url, _) in enumerate(feeds, 1):
+            language = answers.get(str(number))
+            if not isinstance(language, str):
+                continue
+            language = language.strip().strip('"\'.,').capitalize()
+            if not language or len(language) > 50:
+                continue
+
+            domain = self._extract_domain(feed_url)
+            self._cache_insert(domain, language)
+            results[feed_url] = language
+            logger.info(f"Feed {domain} language detected via AI (batch): {language}")
+
+        return results
+
+    # Independent LLM round-trips; a small pool overlaps the waits
+    # without flooding the model server
+    _MAX_DETECTION_WORKERS = 4
+
+    def _detect_concurrently(self, feeds):
+        """
+        Per-feed detection fallback, overlapped on a thread pool.
+
+        Used when the batched call yields an unusable answer: instead of
+        letting every feed fall through to the English default, the
+        proven single-feed prompts run concurrently so the retry costs
+        one round-trip window rather than N serial ones.
+
+        Args:
+            feeds: List of (feed_url, feed_data) tuples to detect
+
+        Returns:
+            dict mapping feed_url -> language name
+        """
+        logger.info(f"Falling back to concurrent per-feed detection for {len(feeds)} feed(s)")
+
+        def detect_one(item):
+            feed_url, feed_data = item
+            return feed_url, self.detect_feed_language(feed_url, feed_data)
+
+        workers = min(len(feeds), self._MAX_DETECTION_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            detected = list(executor.map(detect_one, feeds))
+
+        results = {}
+        for feed_url, language in detected:
+            if language:
+                self._cache_insert(self._extract_domain(feed_url), language)
+                results[feed_url] = language
+
+        return results
+
     def detect_feed_language(self, feed_url, feed_data):
         """
         Detect the language of a feed using AI by sampling article titles/descriptions.
@@ -229,18 +683,26 @@ class FeedLanguageDetector:
         """
         domain = self._extract_domain(feed_url)
 
+        # Sample 2-3 entries for analysis
+        entries = feed_data.get('entries', [])[:3]
+
+        if not entries:
+            logger.warning(f"No entries to analyze for language detection: {feed_url}")
+            return None
+
+        # Try the local classifier first - settles the obvious cases
+        # without any AI traffic
+        language = _local_language_verdict(_sample_text(entries))
+        if language:
+            logger.info(f"Detected language for {domain} locally: {language}")
+            return language
+
         # Check AI availability
-        if not self.client.health_check():
+        if not self._server_available():
             logger.warning("AI server not available, cannot detect feed language")
             return None
 
         try:
-            # Sample 2-3 entries for analysis
-            entries = feed_data.get('entries', [])[:3]
-
-            if not entries:
-                logger.warning(f"No entries to analyze for language detection: {feed_url}")
-                return None
 
             # Build analysis prompt
             prompt = self._build_analysis_prompt(feed_data, entries)
@@ -273,6 +735,15 @@ class FeedLanguageDetector:
             logger.error(f"Error detecting language for {feed_url}: {e}")
             return None
 
+    @staticmethod
+    def _entry_block(number, entry):
+        """Format one entry as a prompt block in a single pass."""
+        block = f"Entry {number}:\n  Title: {_clean_sample(entry.get('title', 'Untitled'))}"
+        description = _clean_sample(entry.get('description', ''))
+        if description:
+            block += f"\n  Description: {description}..."
+        return block
+
     def _build_analysis_prompt(self, feed_data, entries):
         """
         Build prompt for AI to analyze feed content and detect language.
@@ -284,28 +755,20 @@ class FeedLanguageDetector:
         Returns:
             Prompt string
         """
-        feed_title = feed_data.get('title', 'Unknown')
+        feed_title = _clean_sample(feed_data.get('title', 'Unknown'))
 
-        prompt_parts = [
-            f"Feed Title: {feed_title}",
-            "",
-            "Sample Entries:",
-            ""
+        # Two cleaned, tightly capped entries are plenty to name a
+        # language, and prompt length dominates local-model latency
+        entry_blocks = [
+            self._entry_block(i, entry)
+            for i, entry in enumerate(entries[:2], 1)
         ]
 
-        for i, entry in enumerate(entries, 1):
-            title = entry.get('title', 'Untitled')
-            description = entry.get('description', '')[:200]  # Limit description length
-
-            prompt_parts.append(f"Entry {i}:")
-            prompt_parts.append(f"  Title: {title}")
-            if description:
-                prompt_parts.append(f"  Description: {description}...")
-            prompt_parts.append("")
-
-        prompt_parts.append("Based on these feed entries, what language are they written in?")
-
-        return "\n".join(prompt_parts)
+        return (
+            f"Feed Title: {feed_title}\n\nSample Entries:\n\n"
+            + "\n\n".join(entry_blocks)
+            + "\n\nBased on these feed entries, what language are they written in?"
+        )
 
     def _get_system_prompt(self):
         """
@@ -332,11 +795,15 @@ class FeedLanguageDetector:
         Returns:
             Language name or None if parsing fails
         """
-        # Clean and normalize response
-        language = response.strip().strip('"\'.,')
+        # Bound work on malformed multi-paragraph output, then keep just
+        # the first line - a valid answer is a single language name
+        if len(response) > 200:
+            response = response[:200]
+        lines = response.strip().splitlines()
+        language = lines[0].strip().translate(_STRIP_TRANS) if lines else ''
 
         # Validate it's a reasonable response (not too long)
-        if len(language) > 50:
+        if not language or len(language) > 50:
             logger.warning(f"Unexpected language detection response: {language[:50]}...")
             return None
 
@@ -375,5 +842,9 @@ class FeedLanguageDetector:
             language: Language name (e.g., "Italian")
         """
         domain = self._extract_domain(feed_url)
-        self.overrides[domain] = language
+        # Copy-on-write: the loaded mapping is shared (and read-only)
+        # across detector instances, so never mutate it in place
+        overrides = dict(self.overrides)
+        overrides[domain] = language
+        self.overrides = overrides
         logger.info(f"Added language override: {domain} = {language}")
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from .feed_parser import FeedParser
 from .feed_classifier import FeedClassifier
 from ..utils.logging_config import get_logger
-from ..utils.http_client import create_session
+from ..utils.http_client import get_shared_session
 from ..config import MAX_CONCURRENT_FEEDS, FEED_TIMEOUT, TIME_FILTER_HOURS
 
 logger = get_logger(__name__)
@@ -137,8 +137,8 @@ class FeedManager:
         logger.info(f"Processing feed: {feed_url}")
 
         try:
-            # Create session for this feed
-            session = create_session()
+            # Reuse shared session (thread-safe, pooled connections with keep-alive)
+            session = get_shared_session()
 
             # Parse feed
             feed_data = self.parser.parse_feed(feed_url, session=session)
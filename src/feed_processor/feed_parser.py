@@ -5,11 +5,19 @@ import feedparser
 import html
 from datetime import datetime
 from ..utils.logging_config import get_logger
-from ..utils.http_client import fetch_url
+from ..utils.http_client import fetch_url_conditional
 
 logger = get_logger(__name__)
 
 
+def _unescape(text):
+    """
+    Unescape HTML entities, skipping the scan entirely when no '&' is
+    present - the common case for titles and plain-text descriptions.
+    """
+    return html.unescape(text) if '&' in text else text
+
+
 class FeedParser:
     """
     Parse RSS feeds and extract normalized data.
@@ -21,13 +29,14 @@ class FeedParser:
         """
         pass
 
-    def parse_feed(self, feed_url, session=None):
+    def parse_feed(self, feed_url, session=None, max_entries=None):
         """
         Parse an RSS feed and return normalized data.
 
         Args:
             feed_url: URL of RSS feed
             session: requests.Session object
+            max_entries: Stop normalizing after this many entries (None = all)
 
         Returns:
             dict with feed data, or None on error
@@ -35,8 +44,14 @@ class FeedParser:
         logger.info(f"Parsing feed: {feed_url}")
 
         try:
-            # Fetch feed content
-            response = fetch_url(feed_url, session=session)
+            # Fetch feed content (conditional GET - a 304 skips the
+            # transfer but still hands back the cached body, so unchanged
+            # feeds are parsed and processed like any other)
+            response = fetch_url_conditional(feed_url, session=session)
+
+            if getattr(response, 'from_cache', False):
+                logger.info(f"Feed unchanged since last fetch, parsing cached copy: {feed_url}")
+
             feed_content = response.content
 
             # Parse with feedparser
@@ -52,12 +67,16 @@ class FeedParser:
                 'entries': []
             }
 
-            # Parse entries
+            # Parse entries (early exit once max_entries are normalized -
+            # no point unescaping 50 items when the caller wants the latest)
             for entry in feed.entries:
                 entry_data = self._parse_entry(entry, feed_url)
                 if entry_data:
                     feed_data['entries'].append(entry_data)
 
+                    if max_entries and len(feed_data['entries']) >= max_entries:
+                        break
+
             logger.info(f"Parsed {len(feed_data['entries'])} entries from {feed_url}")
             return feed_data
 
@@ -110,7 +129,7 @@ class FeedParser:
     def _extract_title(self, entry):
         """Extract entry title."""
         if hasattr(entry, 'title'):
-            return html.unescape(entry.title)
+            return _unescape(entry.title)
         return "Untitled"
 
     def _extract_link(self, entry):
@@ -122,9 +141,9 @@ class FeedParser:
     def _extract_description(self, entry):
         """Extract entry description."""
         if hasattr(entry, 'description'):
-            return html.unescape(entry.description)
+            return _unescape(entry.description)
         elif hasattr(entry, 'summary'):
-            return html.unescape(entry.summary)
+            return _unescape(entry.summary)
         return ""
 
     def _extract_content(self, entry):
@@ -132,11 +151,11 @@ class FeedParser:
         # Try content:encoded first (common in WordPress)
         if hasattr(entry, 'content'):
             if isinstance(entry.content, list) and len(entry.content) > 0:
-                return html.unescape(entry.content[0].get('value', ''))
+                return _unescape(entry.content[0].get('value', ''))
 
         # Fallback to summary/description
         if hasattr(entry, 'summary_detail'):
-            return html.unescape(entry.summary_detail.get('value', ''))
+            return _unescape(entry.summary_detail.get('value', ''))
 
         # Last resort: use description
         return self._extract_description(entry)
@@ -176,7 +195,7 @@ class FeedParser:
         Returns:
             dict with latest entry data, or None
         """
-        feed_data = self.parse_feed(feed_url, session=session)
+        feed_data = self.parse_feed(feed_url, session=session, max_entries=1)
 
         if feed_data and feed_data['entries']:
             return feed_data['entries'][0]
@@ -32,6 +32,7 @@ class GeminiClient(BaseAIClient):
         if not api_key:
             raise ValueError("Gemini API key is required. Set GEMINI_API_KEY or GOOGLE_API_KEY environment variable.")
 
+        super().__init__()
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
 
@@ -59,25 +60,30 @@ class GeminiClient(BaseAIClient):
         Returns:
             List of model names
         """
+        cached = self._cached_models()
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.base_url}/models"
             params = {"key": self.api_key}
 
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
             models = [model.get('name', '').replace('models/', '') for model in data.get('models', [])]
 
             logger.info(f"Found {len(models)} Gemini models")
-            return models
+            return self._remember_models(models)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to list Gemini models: {e}")
             return []
 
     def generate(self, prompt: str, system: Optional[str] = None,
-                 temperature: float = 0.3, model: Optional[str] = None) -> Optional[str]:
+                 temperature: float = 0.3, model: Optional[str] = None,
+                 max_tokens: Optional[int] = None) -> Optional[str]:
         """
         Generate text using Gemini.
 
@@ -86,6 +92,7 @@ class GeminiClient(BaseAIClient):
             system: System instructions (optional)
             temperature: Temperature for generation
             model: Model to use (required)
+            max_tokens: Cap on generated tokens (default 2048)
 
         Returns:
             Generated text or None on error
@@ -105,7 +112,7 @@ class GeminiClient(BaseAIClient):
                 }],
                 "generationConfig": {
                     "temperature": temperature,
-                    "maxOutputTokens": 2048
+                    "maxOutputTokens": max_tokens if max_tokens is not None else 2048
                 }
             }
 
@@ -115,7 +122,7 @@ class GeminiClient(BaseAIClient):
                     "parts": [{"text": system}]
                 }
 
-            response = requests.post(url, params=params, json=payload, timeout=REQUEST_TIMEOUT)
+            response = self._session.post(url, params=params, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -186,7 +193,7 @@ class GeminiClient(BaseAIClient):
             if system_instruction:
                 payload["systemInstruction"] = system_instruction
 
-            response = requests.post(url, params=params, json=payload, timeout=REQUEST_TIMEOUT)
+            response = self._session.post(url, params=params, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             data = response.json()
@@ -258,7 +265,7 @@ class GeminiClient(BaseAIClient):
                     "parts": [{"text": system}]
                 }
 
-            response = requests.post(url, params=params, json=payload, timeout=REQUEST_TIMEOUT * 2)
+            response = self._session.post(url, params=params, json=payload, timeout=REQUEST_TIMEOUT * 2)
             response.raise_for_status()
 
             data = response.json()
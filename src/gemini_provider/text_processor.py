@@ -51,30 +51,24 @@ class GeminiTextClient(BaseTextProcessor):
         Returns:
             True if clickbait detected, False otherwise
         """
-        try:
-            prompt = f"""Analyze this article title and excerpt to determine if it's clickbait.
-
-Title: {title}
-
-Excerpt: {text[:1000]}
-
-Clickbait characteristics include:
-- Sensationalized or exaggerated headlines
-- Misleading titles that don't match the content
-- Emotional manipulation tactics
-- "You won't believe..." type language
-- Withholding key information to force clicks
-- Overly dramatic or provocative language
+        # Obvious patterns skip the LLM round-trip entirely
+        if self._obvious_clickbait(title):
+            logger.info(f"Clickbait pattern matched: {title[:50]}...")
+            return True
 
-Respond with ONLY "yes" or "no" - nothing else."""
-
-            system_prompt = "You are an expert at identifying clickbait articles. Respond only with 'yes' or 'no'."
+        try:
+            # Static instruction first, variable content last (prompt caching)
+            system_prompt = self.SYSTEM_PROMPT_CLICKBAIT_DETECT
+            prompt = f"Is the following article clickbait?\n\nTitle: {title}\n\nExcerpt: {text[:1000]}"
 
+            # Yes/no classification: one decode token is the whole answer,
+            # so cap generation there instead of paying for a full completion
             response = self.client.generate(
                 prompt=prompt,
                 system=system_prompt,
                 temperature=CLICKBAIT_DETECTION_TEMPERATURE,
-                model=self.model
+                model=self.model,
+                max_tokens=1
             )
 
             if response:
@@ -182,10 +176,7 @@ Respond with ONLY "yes" or "no" - nothing else."""
         """
         logger.debug(f"Generating title in {language}")
 
-        system_prompt = (
-            "You are a headline writer. Generate concise, informative titles "
-            "that are NOT clickbait. Be straightforward and factual."
-        )
+        system_prompt = self.SYSTEM_PROMPT_TITLE
 
         # Generate title with explicit language requirement
         user_prompt = f"IMPORTANT: You MUST respond in {language}. Generate a headline for this summary:\n\n{summary}"
@@ -221,10 +212,7 @@ Respond with ONLY "yes" or "no" - nothing else."""
         Returns:
             System prompt string
         """
-        return (
-            "You are a helpful assistant that summarizes news articles concisely and accurately. "
-            "Focus on the key facts and main points. Keep summaries clear and informative."
-        )
+        return self.SYSTEM_PROMPT_SUMMARIZE
 
     def _get_clickbait_prompt(self) -> str:
         """
@@ -233,13 +221,7 @@ Respond with ONLY "yes" or "no" - nothing else."""
         Returns:
             System prompt string
         """
-        return (
-            "This article shows signs of clickbait or sensationalism. "
-            "Provide an objective, factual summary that strips away dramatic language "
-            "and focuses on verifiable facts only. "
-            "If no substantial facts exist, state 'Clickbait article with no substantial content.' "
-            "Maintain a neutral, skeptical tone and avoid amplifying sensationalism."
-        )
+        return self.SYSTEM_PROMPT_SUMMARIZE_CLICKBAIT
 
     def summarize_article(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -259,4 +241,10 @@ Respond with ONLY "yes" or "no" - nothing else."""
             logger.error("No text provided for summarization")
             return None
 
+        # Reject degenerate inputs before paying for an LLM decode
+        reject = self._validate(text)
+        if reject:
+            logger.info(f"Skipping summarization ({reject}): {title[:50]}...")
+            return self._skipped_result(text, title, reject)
+
         return self.generate_summary(text, title=title, author=author)
@@ -3,13 +3,13 @@ Vision processing with Google Gemini for RSS Feed Processor
 
 This module provides image analysis using Google's Gemini vision capabilities.
 """
-import base64
-import requests
 from pathlib import Path
 from typing import Optional
 from PIL import Image
 from io import BytesIO
 from .client import GeminiClient
+from ..utils.image_utils import encode_image_bytes, downscale_for_vision, MIME_TYPES
+from ..utils.http_client import get_shared_session
 from ..utils.logging_config import get_logger
 from ..config import GEMINI_VISION_MODEL, VISION_TEMPERATURE
 
@@ -52,18 +52,16 @@ class GeminiVisionClient:
 
             # Determine MIME type from extension
             ext = path.suffix.lower()
-            mime_types = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }
-            mime_type = mime_types.get(ext, 'image/jpeg')
-
-            # Read and encode image
+            mime_type = MIME_TYPES.get(ext, 'image/jpeg')
+
+            # Read, downscale, and encode image
             with open(image_path, 'rb') as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+                raw_data = image_file.read()
+
+            image_bytes, vision_mime = downscale_for_vision(raw_data)
+            if image_bytes is not raw_data:
+                mime_type = vision_mime  # re-encoded as JPEG
+            image_data = encode_image_bytes(image_bytes)
 
             return image_data, mime_type
 
@@ -82,15 +80,20 @@ class GeminiVisionClient:
             Tuple of (base64_data, mime_type) or None on error
         """
         try:
-            response = requests.get(image_url, timeout=30)
+            # Shared pooled session: keep-alive avoids a TCP/TLS
+            # handshake per image when a feed serves several pages
+            response = get_shared_session().get(image_url, timeout=30)
             response.raise_for_status()
 
             # Get MIME type from response headers
             content_type = response.headers.get('content-type', 'image/jpeg')
             mime_type = content_type.split(';')[0].strip()
 
-            # Encode image data
-            image_data = base64.b64encode(response.content).decode('utf-8')
+            # Downscale and encode image data
+            image_bytes, vision_mime = downscale_for_vision(response.content)
+            if image_bytes is not response.content:
+                mime_type = vision_mime  # re-encoded as JPEG
+            image_data = encode_image_bytes(image_bytes)
 
             return image_data, mime_type
 
@@ -5,7 +5,7 @@ LM Studio provides an OpenAI-compatible API, so this client uses the
 OpenAI chat completions format for all operations.
 """
 import requests
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
 from ..utils.logging_config import get_logger
 from ..config import LM_STUDIO_BASE_URL, REQUEST_TIMEOUT
 from ..ai_client.base import BaseAIClient
@@ -28,6 +28,7 @@ class LMStudioClient(BaseAIClient):
         Args:
             base_url: LM Studio server base URL
         """
+        super().__init__()
         self.base_url = base_url.rstrip('/')
         self.api_url = f"{self.base_url}/v1"
 
@@ -39,7 +40,7 @@ class LMStudioClient(BaseAIClient):
             True if server is available, False otherwise
         """
         try:
-            response = requests.get(f"{self.api_url}/models", timeout=5)
+            response = self._session.get(f"{self.api_url}/models", timeout=5)
             response.raise_for_status()
             logger.info("LM Studio server is available")
             return True
@@ -54,15 +55,19 @@ class LMStudioClient(BaseAIClient):
         Returns:
             List of model names, or empty list on error
         """
+        cached = self._cached_models()
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(f"{self.api_url}/models", timeout=REQUEST_TIMEOUT)
+            response = self._session.get(f"{self.api_url}/models", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
 
             # OpenAI format: {"data": [{"id": "model-name", ...}, ...]}
             models = [model['id'] for model in data.get('data', [])]
             logger.info(f"Available models: {models}")
-            return models
+            return self._remember_models(models)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to list models: {e}")
@@ -74,7 +79,9 @@ class LMStudioClient(BaseAIClient):
         prompt: str,
         system: Optional[str] = None,
         temperature: float = 0.3,
-        images: Optional[List[str]] = None
+        images: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         Generate text using LM Studio.
@@ -88,6 +95,9 @@ class LMStudioClient(BaseAIClient):
             temperature: Generation temperature
             images: List of base64-encoded images (for vision models)
                    Note: LM Studio vision support may vary by model
+            max_tokens: Cap on generated tokens (None = model default)
+            response_format: OpenAI-style structured output constraint
+                (e.g. json_schema), None for free-form text
 
         Returns:
             Generated text, or None on error
@@ -125,7 +135,8 @@ class LMStudioClient(BaseAIClient):
                 })
 
             # Call the chat API
-            return self.chat(model, messages, temperature)
+            return self.chat(model, messages, temperature, max_tokens=max_tokens,
+                             response_format=response_format)
 
         except Exception as e:
             logger.error(f"Unexpected error in LM Studio generation: {e}")
@@ -135,7 +146,9 @@ class LMStudioClient(BaseAIClient):
         self,
         model: str,
         messages: List[Dict[str, str]],
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         Chat using LM Studio's OpenAI-compatible chat API.
@@ -144,6 +157,9 @@ class LMStudioClient(BaseAIClient):
             model: Model name to use
             messages: List of message dicts with 'role' and 'content'
             temperature: Generation temperature
+            max_tokens: Cap on generated tokens (None = model default)
+            response_format: OpenAI-style structured output constraint
+                (None = free-form text)
 
         Returns:
             Generated response, or None on error
@@ -156,8 +172,14 @@ class LMStudioClient(BaseAIClient):
                 "stream": False
             }
 
+            if max_tokens is not None:
+                payload["max_tokens"] = max_tokens
+
+            if response_format is not None:
+                payload["response_format"] = response_format
+
             logger.debug(f"Sending request to LM Studio model: {model}")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/chat/completions",
                 json=payload,
                 timeout=REQUEST_TIMEOUT * 3  # Longer timeout for generation
@@ -5,11 +5,11 @@ This module provides image analysis using LM Studio's OpenAI-compatible API
 with vision models. It maintains the same interface as the Ollama vision
 processor for seamless provider switching.
 """
-import base64
 import re
 from typing import Optional, Dict, Any
 from PIL import Image
 from .client import LMStudioClient
+from ..utils.image_utils import encode_image_bytes, downscale_for_vision
 from ..utils.logging_config import get_logger
 from ..utils.http_client import fetch_url
 from ..config import (
@@ -58,10 +58,11 @@ class LMStudioVisionClient:
         """
         try:
             response = fetch_url(image_url, session=session)
-            image_data = response.content
+            # Downscale before encoding - the model resizes anyway
+            image_data, _ = downscale_for_vision(response.content)
 
             # Encode to base64
-            encoded = base64.b64encode(image_data).decode('utf-8')
+            encoded = encode_image_bytes(image_data)
             logger.debug(f"Encoded image from {image_url}")
             return encoded
 
@@ -81,9 +82,10 @@ class LMStudioVisionClient:
         """
         try:
             with open(image_path, 'rb') as f:
-                image_data = f.read()
+                # Downscale before encoding - the model resizes anyway
+                image_data, _ = downscale_for_vision(f.read())
 
-            encoded = base64.b64encode(image_data).decode('utf-8')
+            encoded = encode_image_bytes(image_data)
             logger.debug(f"Encoded image from {image_path}")
             return encoded
 
@@ -19,6 +19,7 @@ from .config import (
 )
 from .utils.logging_config import setup_logging, get_logger
 from .utils.file_manager import SafeFileManager
+from .utils.http_client import prewarm_connections
 from .utils.config_wizard import load_config, should_run_first_setup
 from .feed_processor.feed_manager import FeedManager
 from .comics.downloader import ComicDownloader
@@ -228,6 +229,10 @@ def main():
 
         logger.info(f"Loaded {len(feed_urls)} feeds")
 
+        # Prewarm TLS connections to the distinct feed hosts so the first
+        # real fetches skip the handshake
+        prewarm_connections(feed_urls)
+
         # Process all feeds concurrently
         logger.info("Starting concurrent feed processing...")
         processing_results = feed_manager.process_all_feeds(feed_urls, all_entries=args.all_entries)
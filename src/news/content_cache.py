@@ -0,0 +1,149 @@
+"""
+Persistent cache for extracted article content.
+
+Re-testing the same URL (common during dev iteration) refetches the page
+and re-runs trafilatura extraction every time - hundreds of milliseconds
+per article. This cache stores the extracted article data, cleaned text
+and validation result keyed by URL, so repeat lookups return in
+milliseconds.
+
+SQLite is used instead of the JSON sidecar pattern because entries carry
+full article text: rewriting one growing JSON file per store would cost
+more than the extraction it saves.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from ..utils.logging_config import get_logger
+from ..config import CONTENT_CACHE_FILE, CONTENT_CACHE_TTL
+
+logger = get_logger(__name__)
+
+
+class ContentCache:
+    """
+    SQLite-backed cache for extracted and cleaned article content.
+
+    Entries are keyed by a blake2b hash of the URL and expire after a TTL
+    so refreshed articles get re-extracted.
+    """
+
+    def __init__(self, cache_file=CONTENT_CACHE_FILE, ttl_seconds=CONTENT_CACHE_TTL):
+        """
+        Initialize content cache.
+
+        Args:
+            cache_file: Path to SQLite database file
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # One shared connection guarded by the lock; WAL keeps readers and
+        # the writer from blocking each other across processes
+        self._conn = sqlite3.connect(cache_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS content_cache ("
+            "  key TEXT PRIMARY KEY,"
+            "  value TEXT NOT NULL,"
+            "  created_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url):
+        """
+        Build a cache key from a URL.
+
+        blake2b is faster than sha256 on short inputs and 16 bytes is
+        plenty for collision resistance here.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            Hex digest string
+        """
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, url):
+        """
+        Look up cached extraction results for a URL.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            Dict with 'article', 'cleaned_text' and 'validation' keys, or
+            None if missing or expired
+        """
+        key = self.make_key(url)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM content_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if not row:
+                return None
+
+            value, created_at = row
+
+            if time.time() - created_at > self.ttl_seconds:
+                logger.debug(f"Content cache entry expired: {url}")
+                self._conn.execute("DELETE FROM content_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+        try:
+            result = json.loads(value)
+        except ValueError as e:
+            logger.warning(f"Corrupt content cache entry for {url}: {e}")
+            return None
+
+        logger.debug(f"Content cache hit: {url}")
+        return result
+
+    def put(self, url, article_data, cleaned_text, validation):
+        """
+        Store extraction results for a URL.
+
+        Args:
+            url: Article URL
+            article_data: Dict from ArticleExtractor.extract_from_url
+            cleaned_text: Cleaned article text
+            validation: Validation result from ContentCleaner
+
+        Returns:
+            The stored dict (same shape as get), for call-site chaining
+        """
+        result = {
+            'article': article_data,
+            'cleaned_text': cleaned_text,
+            'validation': validation
+        }
+
+        try:
+            value = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Unserializable content for {url}: {e}")
+            return result
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO content_cache (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                (self.make_key(url), value, time.time())
+            )
+            self._conn.commit()
+
+        return result
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -4,6 +4,7 @@ News article summarizer using AI (Ollama, LM Studio, etc.)
 from .article_extractor import ArticleExtractor
 from .content_cleaner import ContentCleaner
 from ..ai_client.base import BaseTextProcessor
+from ..ai_client.cache import SummaryCache
 from ..feed_processor.feed_language_detector import FeedLanguageDetector
 from ..utils.logging_config import get_logger
 
@@ -40,6 +41,7 @@ class NewsSummarizer:
             language_detector = FeedLanguageDetector()
 
         self.language_detector = language_detector
+        self.summary_cache = SummaryCache()
 
     def process_article(self, feed_data):
         """
@@ -93,13 +95,29 @@ class NewsSummarizer:
             # Clean title
             cleaned_title = self.cleaner.clean_title(article_data['title'])
 
-            # Summarize with AI (pass language parameter)
-            summary_data = self.text_client.generate_summary(
-                text=cleaned_text,
+            # Check the summary cache first - syndicated/re-emitted articles
+            # are byte-identical after cleaning, so repeats skip the LLM
+            cache_key = SummaryCache.make_key(
+                cleaned_text,
                 title=cleaned_title,
                 author=article_data.get('author'),
                 language=language
             )
+            summary_data = self.summary_cache.get(cache_key)
+
+            if summary_data:
+                logger.info(f"Summary cache hit for article from {feed_name}")
+            else:
+                # Summarize with AI (pass language parameter)
+                summary_data = self.text_client.generate_summary(
+                    text=cleaned_text,
+                    title=cleaned_title,
+                    author=article_data.get('author'),
+                    language=language
+                )
+
+                if summary_data:
+                    self.summary_cache.put(cache_key, summary_data)
 
             if not summary_data:
                 logger.error(f"Failed to generate summary for {feed_name}")
@@ -151,17 +169,21 @@ class NewsSummarizer:
         """
         results = []
 
+        # Resolve all feed languages up front in one batched call -
+        # overrides and cache settle most feeds locally, and the rest
+        # share a single AI round-trip instead of paying one per feed
+        languages = self.language_detector.get_feed_languages([
+            (feed_data.get('feed_url', ''), feed_data.get('feed_data'))
+            for feed_data in news_feeds
+        ])
+
         for feed_data in news_feeds:
             # Each feed_data now contains 'entries' (plural) instead of 'entry'
             entries = feed_data.get('entries', [])
             feed_name = feed_data.get('feed_name', 'Unknown')
             feed_url = feed_data.get('feed_url', '')
 
-            # Detect language ONCE per feed (not per article)
-            language = self.language_detector.get_feed_language(
-                feed_url,
-                feed_data=feed_data.get('feed_data')  # Original parsed feed data
-            )
+            language = languages.get(feed_url, "English")
 
             logger.info(f"Processing {len(entries)} articles from {feed_name} (language: {language})")
 
@@ -2,13 +2,14 @@
 Base Ollama client for RSS Feed Processor
 """
 import requests
+from ..ai_client.base import BaseAIClient
 from ..utils.logging_config import get_logger
 from ..config import OLLAMA_BASE_URL, REQUEST_TIMEOUT
 
 logger = get_logger(__name__)
 
 
-class OllamaClient:
+class OllamaClient(BaseAIClient):
     """
     Base client for interacting with Ollama API.
     """
@@ -20,6 +21,7 @@ class OllamaClient:
         Args:
             base_url: Ollama server base URL
         """
+        super().__init__()
         self.base_url = base_url.rstrip('/')
         self.api_url = f"{self.base_url}/api"
 
@@ -31,7 +33,7 @@ class OllamaClient:
             True if server is available, False otherwise
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
             logger.info("Ollama server is available")
             return True
@@ -43,21 +45,29 @@ class OllamaClient:
         """
         List available models on the Ollama server.
 
+        Results are memoized for MODELS_CACHE_TTL seconds - callers tend to
+        invoke this right after health_check against the same server.
+
         Returns:
             List of model names, or empty list on error
         """
+        cached = self._cached_models()
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(f"{self.api_url}/tags", timeout=REQUEST_TIMEOUT)
+            response = self._session.get(f"{self.api_url}/tags", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             models = [model['name'] for model in data.get('models', [])]
             logger.info(f"Available models: {models}")
-            return models
+            return self._remember_models(models)
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to list models: {e}")
             return []
 
-    def generate(self, model, prompt, system=None, temperature=0.3, images=None):
+    def generate(self, model, prompt, system=None, temperature=0.3, images=None, max_tokens=None,
+                 format=None):
         """
         Generate text using Ollama.
 
@@ -67,6 +77,10 @@ class OllamaClient:
             system: System prompt (optional)
             temperature: Generation temperature
             images: List of base64-encoded images (for vision models)
+            max_tokens: Cap on generated tokens (maps to num_predict),
+                None for the model default
+            format: Output constraint - "json" or a JSON schema dict
+                (Ollama 0.5+), None for free-form text
 
         Returns:
             Generated text, or None on error
@@ -81,6 +95,12 @@ class OllamaClient:
                 }
             }
 
+            if max_tokens is not None:
+                payload["options"]["num_predict"] = max_tokens
+
+            if format is not None:
+                payload["format"] = format
+
             if system:
                 payload["system"] = system
 
@@ -88,7 +108,7 @@ class OllamaClient:
                 payload["images"] = images
 
             logger.debug(f"Sending request to Ollama model: {model}")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/generate",
                 json=payload,
                 timeout=REQUEST_TIMEOUT * 3  # Longer timeout for generation
@@ -140,7 +160,7 @@ class OllamaClient:
             }
 
             logger.debug(f"Sending chat request to Ollama model: {model}")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/chat",
                 json=payload,
                 timeout=REQUEST_TIMEOUT * 3
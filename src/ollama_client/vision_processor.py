@@ -1,11 +1,11 @@
 """
 Vision processing with Ollama for RSS Feed Processor
 """
-import base64
 import re
 from io import BytesIO
 from PIL import Image
 from .client import OllamaClient
+from ..utils.image_utils import encode_image_bytes, downscale_for_vision
 from ..utils.logging_config import get_logger
 from ..utils.http_client import fetch_url
 from ..config import (
@@ -50,10 +50,11 @@ class OllamaVisionClient:
         """
         try:
             response = fetch_url(image_url, session=session)
-            image_data = response.content
+            # Downscale before encoding - the model resizes anyway
+            image_data, _ = downscale_for_vision(response.content)
 
             # Encode to base64
-            encoded = base64.b64encode(image_data).decode('utf-8')
+            encoded = encode_image_bytes(image_data)
             logger.debug(f"Encoded image from {image_url}")
             return encoded
 
@@ -73,9 +74,10 @@ class OllamaVisionClient:
         """
         try:
             with open(image_path, 'rb') as f:
-                image_data = f.read()
+                # Downscale before encoding - the model resizes anyway
+                image_data, _ = downscale_for_vision(f.read())
 
-            encoded = base64.b64encode(image_data).decode('utf-8')
+            encoded = encode_image_bytes(image_data)
             logger.debug(f"Encoded image from {image_path}")
             return encoded
 
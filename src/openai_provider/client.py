@@ -44,6 +44,7 @@ class OpenAIClient(BaseAIClient):
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+        super().__init__()
         self.base_url = base_url.rstrip('/')
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -61,7 +62,7 @@ class OpenAIClient(BaseAIClient):
         """
         try:
             # Try to list models as a health check
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/models",
                 headers=self.headers,
                 timeout=5
@@ -89,8 +90,12 @@ class OpenAIClient(BaseAIClient):
         Returns:
             List of model IDs, or empty list on error
         """
+        cached = self._cached_models()
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/models",
                 headers=self.headers,
                 timeout=REQUEST_TIMEOUT
@@ -103,7 +108,7 @@ class OpenAIClient(BaseAIClient):
             logger.info(f"Retrieved {len(models)} models from OpenAI")
             logger.debug(f"Available models: {models[:5]}...")  # Log first 5
 
-            return models
+            return self._remember_models(models)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to list OpenAI models: {e}")
@@ -115,7 +120,9 @@ class OpenAIClient(BaseAIClient):
         prompt: str,
         system: Optional[str] = None,
         temperature: float = 0.3,
-        images: Optional[List[str]] = None
+        images: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         Generate text using OpenAI model.
@@ -128,6 +135,9 @@ class OpenAIClient(BaseAIClient):
             system: System prompt (optional)
             temperature: Generation temperature (0.0 to 1.0)
             images: List of base64-encoded images for vision models (optional)
+            max_tokens: Cap on generated tokens (None = default)
+            response_format: Structured output constraint (e.g. json_schema),
+                None for free-form text
 
         Returns:
             Generated text, or None on error
@@ -152,13 +162,16 @@ class OpenAIClient(BaseAIClient):
         else:
             messages.append({"role": "user", "content": prompt})
 
-        return self.chat(model, messages, temperature)
+        return self.chat(model, messages, temperature, max_tokens=max_tokens,
+                         response_format=response_format)
 
     def chat(
         self,
         model: str,
         messages: List[Dict[str, Any]],
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         Chat using OpenAI's chat completions API.
@@ -167,6 +180,8 @@ class OpenAIClient(BaseAIClient):
             model: Model ID to use
             messages: List of message dicts with 'role' and 'content' keys
             temperature: Generation temperature (0.0 to 1.0)
+            max_tokens: Cap on generated tokens (default 1000, enough for summaries)
+            response_format: Structured output constraint (None = free-form)
 
         Returns:
             Generated response, or None on error
@@ -176,12 +191,15 @@ class OpenAIClient(BaseAIClient):
                 "model": model,
                 "messages": messages,
                 "temperature": temperature,
-                "max_tokens": 1000  # Reasonable default for summaries
+                "max_tokens": max_tokens if max_tokens is not None else 1000
             }
 
+            if response_format is not None:
+                payload["response_format"] = response_format
+
             logger.debug(f"Sending chat request to OpenAI model: {model}")
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json=payload,
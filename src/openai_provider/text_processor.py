@@ -61,31 +61,27 @@ class OpenAITextProcessor(BaseTextProcessor):
         if not title or not text:
             return False
 
+        # Obvious patterns skip the LLM round-trip entirely
+        if self._obvious_clickbait(title):
+            logger.info(f"Clickbait pattern matched: {title[:50]}...")
+            return True
+
         # Use first 1000 chars for efficiency and cost
         excerpt = text[:1000]
 
-        system_prompt = (
-            "You are a clickbait detection expert. "
-            "Analyze the article title and excerpt to determine if it is clickbait. "
-            "Clickbait indicators include: "
-            "- Sensationalized or exaggerated headlines "
-            "- Misleading titles that don't match the content "
-            "- Emotional manipulation tactics "
-            "- Exaggerated claims or promises "
-            "- 'You won't believe...', 'This one trick...', 'Shocking...' type language "
-            "- Withholding key information to force clicks "
-            "- Overly dramatic or provocative language "
-            "Respond with ONLY 'yes' if it is clickbait, or 'no' if it is not."
-        )
-
-        user_prompt = f"Title: {title}\n\nExcerpt: {excerpt}\n\nIs this clickbait?"
+        # Static instruction first, variable content last (prefix caching)
+        system_prompt = self.SYSTEM_PROMPT_CLICKBAIT_DETECT
+        user_prompt = f"Is the following article clickbait?\n\nTitle: {title}\n\nExcerpt: {excerpt}"
 
         try:
+            # Yes/no classification: one decode token is the whole answer,
+            # so cap generation there instead of paying for a full completion
             response = self.client.generate(
                 model=self.model,
                 prompt=user_prompt,
                 system=system_prompt,
-                temperature=CLICKBAIT_DETECTION_TEMPERATURE
+                temperature=CLICKBAIT_DETECTION_TEMPERATURE,
+                max_tokens=1
             )
 
             if not response:
@@ -160,32 +156,44 @@ class OpenAITextProcessor(BaseTextProcessor):
         # Use provided language for summary
         logger.info(f"Generating summary in {language}")
 
-        # Use appropriate prompt based on detection with explicit language requirement
+        # One structured call returns summary and title together - half the
+        # requests of the summarize-then-title flow, and the schema keeps the
+        # model from emitting fences or preamble tokens
         if is_clickbait:
-            system_prompt = self._get_clickbait_prompt()
-            user_prompt = f"IMPORTANT: You MUST respond in {language}. Summarize the following article:\n\n{text[:10000]}"
+            system_prompt = self.SYSTEM_PROMPT_SUMMARIZE_CLICKBAIT_STRUCTURED
         else:
-            system_prompt = self._get_standard_prompt()
-            user_prompt = f"IMPORTANT: You MUST respond in {language}. Summarize the following article:\n\n{text[:10000]}"
+            system_prompt = self.SYSTEM_PROMPT_SUMMARIZE_STRUCTURED
+        user_prompt = f"IMPORTANT: You MUST respond in {language}. Summarize the following article:\n\n{text[:10000]}"
 
         try:
-            summary = self.client.generate(
+            raw = self.client.generate(
                 model=self.model,
                 prompt=user_prompt,
                 system=system_prompt,
-                temperature=TEXT_SUMMARY_TEMPERATURE
+                temperature=TEXT_SUMMARY_TEMPERATURE,
+                response_format=self.SUMMARY_RESPONSE_FORMAT
             )
 
-            if not summary:
+            if not raw:
                 logger.error("Failed to generate summary with OpenAI")
                 return None
 
+            parsed = self._parse_structured_summary(raw)
+            if parsed:
+                summary = parsed['summary']
+                generated_title = self._clean_title(parsed['title'])
+            else:
+                # Model ignored the JSON contract - treat output as a plain
+                # summary and fall back to a separate title request
+                summary = raw
+                generated_title = None
+
             # Truncate if too long
             if len(summary) > max_length:
                 summary = summary[:max_length].rsplit('.', 1)[0] + '.'
 
-            # Generate title from summary
-            generated_title = self.generate_title(summary, language=language)
+            if generated_title is None:
+                generated_title = self.generate_title(summary, language=language)
 
             return {
                 'summary': summary,
@@ -211,12 +219,7 @@ class OpenAITextProcessor(BaseTextProcessor):
         """
         logger.debug(f"Generating title in {language}")
 
-        system_prompt = (
-            "You are a professional headline writer. "
-            "Generate a clear, concise, and informative headline (max 80 characters) "
-            "based on the provided summary. "
-            "Do not use clickbait language or sensationalism."
-        )
+        system_prompt = self.SYSTEM_PROMPT_TITLE
 
         # Generate title with explicit language requirement
         user_prompt = f"IMPORTANT: You MUST respond in {language}. Generate a headline for this summary:\n\n{summary}"
@@ -252,13 +255,7 @@ class OpenAITextProcessor(BaseTextProcessor):
         Returns:
             System prompt string
         """
-        return (
-            "You are a professional news summarizer. "
-            "Provide clear, concise, and objective summaries of articles. "
-            "Focus on the key facts, main points, and important details. "
-            "Maintain a neutral, professional tone. "
-            "Keep summaries between 100-300 words."
-        )
+        return self.SYSTEM_PROMPT_SUMMARIZE
 
     def _get_clickbait_prompt(self) -> str:
         """
@@ -267,13 +264,7 @@ class OpenAITextProcessor(BaseTextProcessor):
         Returns:
             System prompt string
         """
-        return (
-            "This article shows signs of clickbait or sensationalism. "
-            "Provide an objective, factual summary that strips away dramatic language "
-            "and focuses on verifiable facts only. "
-            "If no substantial facts exist, state 'Clickbait article with no substantial content.' "
-            "Maintain a neutral, skeptical tone and avoid amplifying sensationalism."
-        )
+        return self.SYSTEM_PROMPT_SUMMARIZE_CLICKBAIT
 
     def summarize_article(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -292,7 +283,13 @@ class OpenAITextProcessor(BaseTextProcessor):
 
         logger.info(f"Summarizing article with OpenAI: {original_title[:50]}...")
 
-        result = self.generate_summary(text, title=original_title, author=author)
+        # Reject degenerate inputs before paying for an LLM decode
+        reject = self._validate(text)
+        if reject:
+            logger.info(f"Skipping summarization ({reject}): {original_title[:50]}...")
+            result = self._skipped_result(text, original_title, reject)
+        else:
+            result = self.generate_summary(text, title=original_title, author=author)
 
         if result:
             result['original_title'] = original_title
@@ -4,10 +4,10 @@ Vision processing with OpenAI GPT-4 Vision for RSS Feed Processor
 This module provides image analysis capabilities using GPT-4 Vision API.
 It maintains a similar interface to OllamaVisionClient for consistency.
 """
-import base64
 import re
 from typing import Optional
 from .client import OpenAIClient
+from ..utils.image_utils import encode_image_bytes, downscale_for_vision
 from ..utils.logging_config import get_logger
 from ..utils.http_client import fetch_url
 from ..config import VISION_TEMPERATURE
@@ -59,10 +59,11 @@ class OpenAIVisionProcessor:
         """
         try:
             response = fetch_url(image_url, session=session)
-            image_data = response.content
+            # Downscale before encoding - the model resizes anyway
+            image_data, _ = downscale_for_vision(response.content)
 
             # Encode to base64
-            encoded = base64.b64encode(image_data).decode('utf-8')
+            encoded = encode_image_bytes(image_data)
             logger.debug(f"Encoded image from {image_url}")
             return encoded
 
@@ -82,9 +83,10 @@ class OpenAIVisionProcessor:
         """
         try:
             with open(image_path, 'rb') as f:
-                image_data = f.read()
+                # Downscale before encoding - the model resizes anyway
+                image_data, _ = downscale_for_vision(f.read())
 
-            encoded = base64.b64encode(image_data).decode('utf-8')
+            encoded = encode_image_bytes(image_data)
             logger.debug(f"Encoded image from {image_path}")
             return encoded
 
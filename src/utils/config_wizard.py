@@ -2,6 +2,7 @@
 Configuration Wizard for RSS Feed Processor
 Interactive setup tool for first-run configuration and ongoing management.
 """
+import functools
 import json
 import os
 import sys
@@ -72,6 +73,11 @@ AI_PROVIDERS = {
 }
 
 
+# Parsed config keyed by (path, mtime) - the wizard re-reads the config on
+# every action, so an unchanged file costs one stat() instead of a JSON parse
+_config_cache = {}
+
+
 def load_config() -> Optional[Dict]:
     """
     Load configuration from .config.json file.
@@ -83,9 +89,18 @@ def load_config() -> Optional[Dict]:
         return None
 
     try:
+        cache_key = (str(CONFIG_FILE), CONFIG_FILE.stat().st_mtime_ns)
+
+        if cache_key in _config_cache:
+            return _config_cache[cache_key]
+
         with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+            config = json.load(f)
+
+        _config_cache.clear()
+        _config_cache[cache_key] = config
+        return config
+    except (json.JSONDecodeError, IOError, OSError) as e:
         print(f"Error loading configuration: {e}")
         return None
 
@@ -101,8 +116,14 @@ def save_config(config: Dict) -> bool:
         True if successful, False otherwise
     """
     try:
-        with open(CONFIG_FILE, 'w') as f:
+        # Write to a temp file and atomically rename so a crash mid-save
+        # can't leave a truncated config behind
+        temp_path = CONFIG_FILE.with_name(CONFIG_FILE.name + '.tmp')
+        with open(temp_path, 'w') as f:
             json.dump(config, f, indent=2)
+        os.replace(temp_path, CONFIG_FILE)
+
+        _config_cache.clear()
         return True
     except IOError as e:
         print(f"Error saving configuration: {e}")
@@ -180,10 +201,15 @@ def get_yes_no(prompt: str, default: bool = True) -> bool:
     return response in ['y', 'yes']
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_url(url: str) -> bool:
     """
     Validate if a string is a valid URL.
 
+    Results are memoized - the whole feed list is re-validated on every
+    wizard interaction, so repeat URLs become a dict lookup instead of a
+    fresh urlparse. (Tests can reset with validate_url.cache_clear().)
+
     Args:
         url: URL to validate
 
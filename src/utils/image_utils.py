@@ -0,0 +1,132 @@
+"""
+Shared image encoding helpers for the vision processors.
+
+Every provider's vision path base64-encodes raw comic images before
+posting them. For the 500KB-5MB PNGs webcomics ship, the encode is a
+measurable slice of client CPU time, so we prefer pybase64 (SIMD
+accelerated, ~4-5x faster on large payloads) and fall back to the
+stdlib when it isn't installed.
+"""
+import base64
+from functools import lru_cache
+from io import BytesIO
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+from PIL import Image
+
+from .logging_config import get_logger
+from ..config import VISION_MAX_DIMENSION, VISION_JPEG_QUALITY
+
+logger = get_logger(__name__)
+
+# MIME types by file extension - single source of truth, built once at
+# module load instead of per encode call
+MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+
+@lru_cache(maxsize=64)
+def mime_for_suffix(suffix):
+    """
+    Map a bare file suffix (no leading dot) to a MIME type.
+
+    A feed run resolves the same handful of suffixes hundreds of times,
+    so the lower+concat+lookup is memoized per distinct suffix.
+
+    Args:
+        suffix: File suffix without the dot, any case
+
+    Returns:
+        MIME type string, defaulting to image/jpeg
+    """
+    return MIME_TYPES.get('.' + suffix.lower(), 'image/jpeg')
+
+
+def encode_image_bytes(image_data):
+    """
+    Base64-encode raw image bytes to a str.
+
+    Args:
+        image_data: Raw image bytes
+
+    Returns:
+        Base64-encoded string
+    """
+    if pybase64 is not None:
+        # Returns str directly, skipping the intermediate .decode() copy
+        return pybase64.b64encode_as_string(image_data)
+    return base64.b64encode(image_data).decode('utf-8')
+
+
+def encode_image_file(image_path):
+    """
+    Read an image file and base64-encode its contents.
+
+    Args:
+        image_path: Path to image file
+
+    Returns:
+        Base64-encoded string
+    """
+    with open(image_path, 'rb') as f:
+        return encode_image_bytes(f.read())
+
+
+def downscale_for_vision(image_data, max_dimension=VISION_MAX_DIMENSION,
+                         quality=VISION_JPEG_QUALITY):
+    """
+    Downscale raw image bytes before sending them to a vision model.
+
+    Vision models resize/tile inputs to around 1024px internally, so a
+    4000px comic PNG only inflates upload size (plus the 1.33x base64
+    expansion) without improving the analysis. Images over max_dimension
+    are thumbnailed with LANCZOS and re-encoded as JPEG.
+
+    Args:
+        image_data: Raw image bytes
+        max_dimension: Longest allowed side in pixels
+        quality: JPEG quality for the re-encode
+
+    Returns:
+        Tuple of (image_bytes, mime_type). The original bytes come back
+        unchanged when the image is small enough or can't be decoded.
+    """
+    try:
+        with Image.open(BytesIO(image_data)) as img:
+            mime_type = Image.MIME.get(img.format, 'image/jpeg')
+
+            if max(img.size) <= max_dimension:
+                return image_data, mime_type
+
+            # Re-encoding an animated GIF would keep only the first
+            # frame, so pass those through at full size
+            if getattr(img, 'is_animated', False):
+                return image_data, mime_type
+
+            original_size = img.size
+            img.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+
+            buffer = BytesIO()
+            img.save(buffer, format='JPEG', quality=quality, optimize=True)
+
+            logger.debug(
+                f"Downscaled vision input {original_size} -> {img.size}, "
+                f"{len(image_data)} -> {buffer.tell()} bytes"
+            )
+            return buffer.getvalue(), 'image/jpeg'
+
+    except Exception as e:
+        logger.warning(f"Could not downscale image for vision input: {e}")
+        return image_data, 'image/jpeg'